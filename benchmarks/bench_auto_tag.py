@@ -0,0 +1,65 @@
+"""
+Micro-benchmark: Aho-Corasick auto_tag vs the original per-keyword scan.
+
+Uses the Name/Title + Information/Details text of every row in
+data/Master.csv, checks both implementations agree, then times them.
+
+    python benchmarks/bench_auto_tag.py [--repeat N]
+"""
+
+import argparse
+import csv
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from consolidate.config import DATA_DIR, KEYWORD_TAGS  # noqa: E402
+from consolidate.matcher import default_matcher  # noqa: E402
+from consolidate.parsing import auto_tag  # noqa: E402
+
+
+def auto_tag_scan(text):
+    """The pre-automaton implementation: one substring search per keyword."""
+    text_lower = text.lower()
+    found = []
+    for tag, keywords in KEYWORD_TAGS:
+        if any(kw in text_lower for kw in keywords):
+            found.append(tag)
+    return found
+
+
+def load_texts():
+    with open(os.path.join(DATA_DIR, 'Master.csv'), encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    return [' '.join([row[0], row[5] if len(row) > 5 else '']) for row in rows[1:] if row]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    texts = load_texts()
+    mismatches = [t for t in texts if auto_tag(t) != auto_tag_scan(t)]
+    if mismatches:
+        sys.exit(f'{len(mismatches)} texts disagree, e.g. {mismatches[0][:80]!r}')
+
+    matcher = default_matcher()
+    if matcher.match_all(texts) != [matcher.match_mask(t.lower()) for t in texts]:
+        sys.exit('match_all disagrees with match_mask')
+
+    auto_tag(texts[0])  # compile the automaton outside the timed region
+    print(f'{len(texts)} texts, {sum(map(len, texts))} chars, '
+          f'{sum(len(k) for _, k in KEYWORD_TAGS)} keywords')
+    cases = (('per-keyword scan', lambda: [auto_tag_scan(t) for t in texts]),
+             ('aho-corasick', lambda: [auto_tag(t) for t in texts]),
+             ('bulk match_all', lambda: matcher.match_all(texts)))
+    for label, fn in cases:
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        print(f'  {label:<18} {best * 1000:8.2f} ms  ({best / len(texts) * 1e6:6.2f} µs/text)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Micro-benchmark: shared line classifier vs the original inline checks.
+
+Times classify_line() over every non-name Housing-Felon-Friendly line and
+split_web_email() over every web/email cell of the standard sheets against
+the original inline code.  tests/test_classify.py pins that both give the
+same results; this script only prints per-line / per-cell timings.
+
+    python benchmarks/bench_classify.py [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tests'))
+
+from consolidate.classify import classify_line, split_web_email  # noqa: E402
+from classify_reference import (  # noqa: E402
+    classify_line_inline, load_lines, load_web_cells, split_web_email_inline,
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    lines = load_lines()
+    cells = load_web_cells()
+    print(f'{len(lines)} Housing-Felon-Friendly lines, {len(cells)} web/email cells')
+
+    cases = [
+        ('classify_line', 'inline chain', lines, classify_line_inline),
+        ('classify_line', 'shared', lines, classify_line),
+        ('split_web_email', 'inline', cells, split_web_email_inline),
+        ('split_web_email', 'shared', cells, split_web_email.__wrapped__),
+        ('split_web_email', 'memoized', cells, split_web_email),
+    ]
+    for what, label, items, fn in cases:
+        best = min(timeit.repeat(lambda: [fn(x) for x in items], number=20, repeat=args.repeat)) / 20
+        print(f'  {what:<16} {label:<13} {best / len(items) * 1e9:8.0f} ns/item')
+
+
+if __name__ == '__main__':
+    main()
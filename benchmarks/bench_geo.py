@@ -0,0 +1,80 @@
+"""
+Benchmark: grid nearest() vs a linear scan over every geocoded record.
+
+Geocodes the Physical Address of every row in data/Master.csv with the
+bundled place table, builds a GeoIndex, then for a fixed set of query
+points, radii and tag filters checks that nearest() returns exactly what
+a brute-force scan does and times both.
+
+    python benchmarks/bench_geo.py [--repeat N] [--k N]
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from consolidate.config import DATA_DIR  # noqa: E402
+from consolidate.geo import GeoIndex, distance_miles, geocode, load_places  # noqa: E402
+from consolidate.record import tags_mask  # noqa: E402
+
+TAG_FILTERS = [None, ['Food'], ['Housing', 'Weather-Shelter'], ['Veterans']]
+RADII = [5, 25, 100]
+
+
+def load_points():
+    with open(os.path.join(DATA_DIR, 'Master.csv'), newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))[1:]
+    points = []
+    for rid, row in enumerate(rows):
+        hit = geocode(row[4]) if len(row) > 4 else None
+        if hit:
+            tags = row[6].split('; ') if len(row) > 6 and row[6] else ()
+            points.append((rid, hit[1], hit[2], tags_mask(tags)))
+    return len(rows), points
+
+
+def nearest_scan(points, lat, lon, k, miles, tags):
+    want = tags_mask(tags) if tags else 0
+    found = [(d, rid) for rid, plat, plon, ptags in points
+             if (not want or ptags & want)
+             for d in (distance_miles(lat, lon, plat, plon),) if d <= miles]
+    found.sort()
+    return found[:k]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--k', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    total, points = load_points()
+    index = GeoIndex(points)
+    rng = random.Random(0)
+    places = list(load_places()[0].values())
+    # Place centroids (dense ties) plus jittered points between them
+    queries = places[:20] + [(lat + rng.uniform(-0.3, 0.3), lon + rng.uniform(-0.3, 0.3))
+                             for lat, lon in rng.sample(places, 20)]
+    cases = [(lat, lon, miles, tags) for lat, lon in queries
+             for miles in RADII for tags in TAG_FILTERS]
+
+    bad = [c for c in cases
+           if index.nearest(c[0], c[1], args.k, c[2], c[3])
+           != nearest_scan(points, c[0], c[1], args.k, c[2], c[3])]
+    if bad:
+        sys.exit(f'{len(bad)} queries disagree with the linear scan, e.g. {bad[0]!r}')
+    print(f'{len(points)} of {total} records geocoded; {len(cases)} queries match the scan')
+
+    for label, fn in (('linear scan', lambda c: nearest_scan(points, c[0], c[1], args.k, c[2], c[3])),
+                      ('grid index', lambda c: index.nearest(c[0], c[1], args.k, c[2], c[3]))):
+        best = min(timeit.repeat(lambda: [fn(c) for c in cases], number=1, repeat=args.repeat))
+        print(f'  {label:<12} {best / len(cases) * 1e6:8.1f} µs/query')
+
+
+if __name__ == '__main__':
+    main()
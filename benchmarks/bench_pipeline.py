@@ -0,0 +1,158 @@
+"""
+Pipeline benchmark on synthetic data at several scales, with a JSON baseline.
+
+For each scale (default 1x, 10x and 100x the shipped row counts) this
+generates the source sheets with synthetic.generate(), then times
+split_web_email() over every web/email cell, auto_tag() over every base
+record, and each pipeline stage of a full run (best of --repeat runs;
+"merging" sums the merge stages, "write" is the sort and write).  Every
+memo in MEMOS is cleared before each timed repeat, so repeats measure the
+parsing work rather than cache hits left by the previous one.
+
+Results go to benchmarks/baseline.json with --save; otherwise they are
+compared against it and the run exits non-zero if any timing grew by more
+than --tolerance and by more than MIN_DELTA seconds.
+
+    python benchmarks/bench_pipeline.py [--scales 1,10,100] [--repeat N]
+                                        [--save] [--tolerance 0.25]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from consolidate.classify import split_web_email  # noqa: E402
+from consolidate.config import BASE_SHEET, TAG_FILES  # noqa: E402
+from consolidate.memo import MEMOS  # noqa: E402
+from consolidate.parsing import auto_tag, read_csv_raw  # noqa: E402
+from consolidate.pipeline import run  # noqa: E402
+
+from synthetic import generate, source_counts  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+BASELINE_VERSION = 1
+MERGE_STAGES = ('master load', 'rural/so merge', 'weather-shelter',
+                'housing-felon-friendly', 'jobs-felon-friendly')
+MIN_DELTA = 0.01  # millisecond-scale timings jitter by more than any tolerance
+
+
+def clear_memos():
+    for memo in MEMOS.values():
+        memo.cache_clear()
+
+
+def time_calls(fn, items, repeat):
+    return min(timeit.repeat(lambda: [fn(x) for x in items], setup=clear_memos,
+                             number=1, repeat=repeat))
+
+
+def bench_scale(scale, counts, repeat):
+    with tempfile.TemporaryDirectory() as data_dir:
+        written = generate(data_dir, scale, counts=counts)
+        cells = [row[2] for fname in TAG_FILES
+                 for row in read_csv_raw(fname, data_dir)[1:] if len(row) > 2]
+        texts = [row[0] + ' ' + row[5] for row in read_csv_raw(BASE_SHEET, data_dir)[1:]]
+        auto_tag(texts[0])  # compile the automaton outside the timed region
+
+        stages = {}
+        records = 0
+        for _ in range(repeat):
+            clear_memos()
+            with contextlib.redirect_stdout(io.StringIO()):
+                build, stats = run(data_dir, trace_memory=False, report=False)
+            records = len(build.sorted_records)
+            for s in stats:
+                stages[s.name] = min(stages.get(s.name, s.seconds), s.seconds)
+
+    return {
+        'rows':            sum(written.values()),
+        'records':         records,
+        'split_web_email': time_calls(split_web_email, cells, repeat),
+        'auto_tag':        time_calls(auto_tag, texts, repeat),
+        'merging':         sum(stages[name] for name in MERGE_STAGES),
+        'write':           stages['write'],
+        'total':           sum(stages.values()),
+        'stages':          stages,
+    }
+
+
+def flatten(results):
+    """Yield (label, seconds) for every timing in a results dict."""
+    for scale, res in results.items():
+        for key in ('split_web_email', 'auto_tag', 'merging', 'write', 'total'):
+            yield f'{scale}x {key}', res[key]
+        for name, seconds in res['stages'].items():
+            yield f'{scale}x stage {name}', seconds
+
+
+def compare(results, baseline, tolerance):
+    """Print current vs baseline timings; return labels that regressed."""
+    old = dict(flatten(baseline['scales']))
+    regressed = []
+    print(f'\n  {"timing":<38} {"baseline":>10} {"current":>10} {"ratio":>7}')
+    for label, seconds in flatten(results):
+        if label not in old:
+            continue
+        ratio = seconds / old[label] if old[label] else float('inf')
+        flag = ''
+        if ratio > 1 + tolerance and seconds - old[label] > MIN_DELTA:
+            regressed.append(label)
+            flag = '  SLOWER'
+        print(f'  {label:<38} {old[label]:10.4f} {seconds:10.4f} {ratio:7.2f}{flag}')
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scales', default='1,10,100',
+                        help='comma-separated multiples of the shipped row counts')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--save', action='store_true',
+                        help=f'write results to {os.path.basename(BASELINE_PATH)}')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed slowdown before a timing counts as a regression')
+    args = parser.parse_args(argv)
+
+    counts = source_counts()
+    results = {}
+    for scale in (int(s) for s in args.scales.split(',')):
+        res = bench_scale(scale, counts, args.repeat)
+        results[str(scale)] = res
+        print(f'{scale:>4}x  {res["rows"]:>8} rows → {res["records"]:>7} records  '
+              f'split_web_email {res["split_web_email"]:.4f}s  '
+              f'auto_tag {res["auto_tag"]:.4f}s  merging {res["merging"]:.4f}s  '
+              f'write {res["write"]:.4f}s  total {res["total"]:.4f}s')
+
+    if args.save:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'version': BASELINE_VERSION, 'python': platform.python_version(),
+                       'scales': results}, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f'Saved baseline to {args.baseline}')
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f'No baseline at {args.baseline}; rerun with --save to record one.')
+        return
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('version') != BASELINE_VERSION:
+        sys.exit(f'{args.baseline}: unsupported baseline version {baseline.get("version")}')
+    regressed = compare(results, baseline, args.tolerance)
+    if regressed:
+        sys.exit(f'{len(regressed)} timing(s) slower than baseline by more than '
+                 f'{args.tolerance:.0%}')
+    print('No regressions against baseline.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+Recall/latency benchmark: BM25 top-k retrieval vs the full-prompt baseline.
+
+The chat route's baseline puts every record of data/Master.csv into the
+prompt, so it "retrieves" everything at the cost of the whole file.  This
+builds the search index from Master.csv as the pipeline does, runs a
+fixed set of sample queries, and reports per query:
+
+  - lexical: records containing every query term (after stemming) in
+    their name, tags or details, and the share of those in the top k (out
+    of min(k, lexical)).  BM25 favours exactly these records, so this is
+    close to 1.0 by construction and only shows lexical matches are kept;
+  - judged: the hand-labelled relevant records of search_judgments.py,
+    which include records that match only by synonym or a related term
+    ("detox" for "substance abuse treatment"), and recall@k against them;
+  - latency of search() in milliseconds (best of --repeat).
+
+It ends with the prompt size of the full baseline vs a top-k slice.
+
+    python benchmarks/bench_search.py [--k N] [--repeat N]
+"""
+
+import argparse
+import csv
+import os
+import statistics
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from consolidate.acronyms import load_acronyms  # noqa: E402
+from consolidate.config import DATA_DIR, OUTPUT_COLS  # noqa: E402
+from consolidate.search import SearchIndex, build_search_index, terms  # noqa: E402
+
+from search_judgments import JUDGMENTS  # noqa: E402
+
+QUERIES = [
+    ('food pantry', None),
+    ('felon friendly housing', None),
+    ('emergency shelter', None),
+    ('shelter', ['Weather-Shelter']),
+    ('veterans benefits', None),
+    ('legal aid', None),
+    ('lgbtq youth', None),
+    ('mental health counseling', None),
+    ('substance abuse treatment', None),
+    ('rent assistance', None),
+    ('job training', ['Employment']),
+    ('medicaid', None),
+    ('transportation to medical appointments', None),
+    ('meals', ['Elderly']),
+    ('domestic violence', None),
+    ('dental care', ['Medical']),
+    ('native american', None),
+    ('ged', None),
+    ('utility bill help', None),
+    ('sex offender treatment', None),
+]
+LABELS = {'Tags': 'Tags', 'Phone': 'Phone', 'Web/Link': 'Web', 'Email': 'Email',
+          'Physical Address': 'Address', 'Information/Details': 'Details'}
+
+
+def load_rows():
+    with open(os.path.join(DATA_DIR, 'Master.csv'), newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    return [dict(zip(OUTPUT_COLS, row)) for row in rows[1:] if row]
+
+
+def format_record(rec):
+    """One prompt line per record, as web/app/api/chat/route.ts formats it."""
+    parts = [f'**{rec["Name/Title"]}**']
+    parts += [f'{label}: {rec[col]}' for col, label in LABELS.items() if rec[col]]
+    return ' | '.join(parts)
+
+
+def relevant_ids(docs, query, tags):
+    want = set(terms(query))
+    return {rid for rid, (doc_terms, doc_tags) in enumerate(docs)
+            if want <= doc_terms and (not tags or doc_tags & set(tags))}
+
+
+def recall(relevant, top, k):
+    return len(relevant & set(top)) / min(k, len(relevant))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--k', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rows = load_rows()
+    tag_lists = [rec['Tags'].split('; ') if rec['Tags'] else [] for rec in rows]
+    acronyms = load_acronyms()
+    t0 = timeit.default_timer()
+    index = SearchIndex(build_search_index(
+        ((rec['Record ID'], acronyms.expand(rec['Name/Title'], keep=True), tags,
+          acronyms.expand(rec['Information/Details'], keep=True))
+         for rec, tags in zip(rows, tag_lists)),
+        acronyms.synonyms()))
+    build_s = timeit.default_timer() - t0
+    row_of = {rec_id: row for row, rec_id in enumerate(index.ids)}
+    docs = [(set(terms(' '.join([rec['Name/Title'], rec['Tags'], rec['Information/Details']]))),
+             set(tags)) for rec, tags in zip(rows, tag_lists)]
+
+    print(f'{len(rows)} records; index built in {build_s * 1000:.0f} ms\n')
+    at_k = f'recall@{args.k}'
+    print(f'  {"query":<40} {"lexical":>8} {at_k:>10} {"judged":>7} {at_k:>10} {"ms":>7}')
+    lexical_recalls, judged_recalls, latencies, missing = [], [], [], []
+    for query, tags in QUERIES:
+        relevant = relevant_ids(docs, query, tags)
+        judged_ids = JUDGMENTS.get((query, tuple(tags) if tags else None), {})
+        missing += [rec_id for rec_id in judged_ids if rec_id not in row_of]
+        judged = {row_of[rec_id] for rec_id in judged_ids if rec_id in row_of}
+        top = index.rank(query, tags, args.k)
+        ms = min(timeit.repeat(lambda: index.rank(query, tags, args.k),
+                               number=1, repeat=args.repeat)) * 1000
+        latencies.append(ms)
+        label = query + (f' [{", ".join(tags)}]' if tags else '')
+        cells = []
+        for found, recalls in ((relevant, lexical_recalls), (judged, judged_recalls)):
+            if found:
+                recalls.append(recall(found, top, args.k))
+                cells.append(f'{recalls[-1]:.2f}')
+            else:
+                cells.append('-')
+        print(f'  {label:<40} {len(relevant):>8} {cells[0]:>10} {len(judged):>7} {cells[1]:>10} '
+              f'{ms:>7.2f}')
+
+    full = '\n'.join(format_record(rec) for rec in rows)
+    slices = [len('\n'.join(format_record(rows[rid]) for rid in index.rank(q, t, args.k)))
+              for q, t in QUERIES]
+    print(f'\nmean {at_k}: lexical {statistics.mean(lexical_recalls):.3f} over '
+          f'{len(lexical_recalls)} queries, judged {statistics.mean(judged_recalls):.3f} over '
+          f'{len(judged_recalls)} queries; latency median {statistics.median(latencies):.2f} ms, '
+          f'max {max(latencies):.2f} ms')
+    if missing:
+        print(f'{len(missing)} judged record id(s) not in Master.csv: {", ".join(missing)}')
+    print(f'prompt size: full baseline {len(full):,} chars (recall 1.0 by construction), '
+          f'top-{args.k} slice median {int(statistics.median(slices)):,} chars '
+          f'({statistics.median(slices) / len(full):.1%} of baseline)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""
+Hand-labelled relevance judgments for bench_search.py.
+
+Each entry maps a sample query (with its tag filter) to the records of
+data/Master.csv a caseworker would want for it, by Record ID, with the
+name for review.  The lists were built by reading every record that
+mentions the topic or a related term, not by matching the query words,
+so they include records that never use them: "Gateway Battered Women's
+Services" for "domestic violence", "Avenues Detox and Rehab" for
+"substance abuse treatment", "Call-a-Lawyer" for "legal aid".  Records a
+query only brushes against (felon-friendly housing policies that list
+"Violence Against Other Person", pet food pantries) are left out.
+
+Ids are stable across builds, but a merge or rename drops one;
+bench_search.py reports ids missing from Master.csv so the list can be
+updated.
+"""
+
+JUDGMENTS = {
+    ('food pantry', None): {
+        '3edadf913f3d': "Charities' Hope",
+        '352cf6f7030a': 'Cross Fire Ministries',
+        'c8fd7f0270bd': 'Deerfield Hills Community Center',
+        '8a6f0a0fc16e': 'Feeding Friends',
+        '3e961989137a': "God's Pantry Ministries",
+        'a344c7fc5058': 'Israelite Christian Church',
+        'e50f810a4f0a': 'New Life Local Outreach/Church',
+        'e16ff7303312': 'Solid Rock Food Pantry',
+        '6ec43b8ef514': 'Care and Share',                       # food bank
+        'b836fd18f37c': 'Central Seventh Day Adventist Church',  # emergency food, commodities
+        '13c69f302e83': 'Compassion Food Distribution',
+        '54c818406e2b': 'Fresh Start Center',                   # food distribution
+        'b247278f3d35': 'Good News Foundation',                 # food distribution center
+        'c77a29b5aa6b': 'Jeffco Action Center',                 # food box
+        'd39e3fd1983f': 'Mercy Today Ministries & Church',      # food bank
+        '826e5a2407d3': 'No Cost Drive Through Grocery Program',
+        '2d407a4f2076': 'Springs Food Bank',
+        '87b14788922c': 'The Emergency Food Assistance Program TEFAP',
+    },
+    ('domestic violence', None): {
+        '2c58e67e09a5': 'Advocacy Services',
+        '35e39a8603bc': 'Advocate Safehouse Project',
+        '281f57bce3cf': 'Alliance, The',
+        'b6a543d4d001': 'Alternative Horizons',
+        '560ba85d1eb9': 'Adults Molested As Children Group',
+        '04170a55f5cd': 'Kingdom Builders',
+        '729bfb6ee098': 'Haseya Advocate Program',
+        '9e26b3b4d02d': 'National Coalition Against Domestic Violence',
+        '4d49aad228cf': 'National Domestic Violence Hotline',
+        'e2e18d551d92': 'TESSA',
+        '0568b9e3cbac': 'Voces Unidas for Justice',
+        'c476863d0057': 'Gateway Battered Women’s Services',
+        '125bf4022276': 'SafeHouse Denver',
+        '9bb60e15c9c9': 'Safehouse Progressive Alliance for Nonviolence',
+        '1c5ab70e40d9': 'Volunteers of America Southwest Safehouse',
+        'feb186e3c5d4': 'Advocates Routt County',               # "dv", safe house
+        'd905b57703f1': 'Advocates Against Domestic Assault',
+        '7eecd0cd91ff': 'Advocates for a Violence-Free Community',
+        '57bda65a0897': 'YWCA of Pueblo Family Crisis Shelter',
+    },
+    ('substance abuse treatment', None): {
+        '331e2bae57e8': 'Gateway to Success',
+        '0bd23e47a853': 'Peaks Recovery Centers',
+        'c0e60124e761': 'Restoring Lives Project',
+        'bc5c6f016482': 'Innova Recovery Services',
+        'da07e11ea14b': 'Accessia Health',                      # MAT, detox
+        'd77c90d079ea': 'Avenues Detox and Rehab',
+        '106e92a38641': 'Colorado Treatment Services',          # methadone, suboxone
+        'bdcddc17be18': 'El Paso County Detox Facility',
+        '032114e2d4c0': 'Sandstone Care',                       # drug/alcohol tx
+        '4bfdb14785a3': 'West Pines Behavioral Health',         # medical detox
+        '6753cc8bf6bf': 'Recovery Village at Palmer Lake',
+        '9fda13b39c52': 'Recovery Systems PC',                  # SUD counseling
+        'c7e006ef017a': 'Rock Your Family',                     # addiction treatment
+        '8fa3d7282fc2': 'Mountain Springs Recovery',            # addiction rehab
+        '0617e6445a91': 'SAMHSA',                               # treatment directory
+        '39755b137fe2': 'Valley Hope',                          # SUD rehab
+        'abdcbcaaec3d': 'Dual Diagnosis rehabs',
+        '218c43c061f7': 'Find Treatment',                       # drug tx
+    },
+    ('legal aid', None): {
+        '210faffaf807': 'Project Hope of Gunnison Valley',
+        'e0b660b56088': 'Colorado Legal Services',
+        'b7102f8d4603': 'Free Legal Self-Help Clinic',
+        '3b12033f009c': 'Legal Assistance (JAG) for military',
+        'e2e18d551d92': 'TESSA',
+        'db4e2868db2f': 'SLV Immigrant Resource Center',
+        '9295c567376b': 'Rocky Mountain Victim Law Center',
+        '8b9bdd8e4ffa': 'Immigrant Hope',
+        '0ab86a8d51b3': 'Call-a-Lawyer',
+        '5cfdbf40f481': 'Colorado Bar Association',
+        '34754cb2379e': 'El Paso County Lawyer Referral',
+        '7bcd2c464141': 'Justice Center C/S',                   # lawyer referral
+        'e532c17e0b00': 'Public Defenders',
+        'fbe2fde300d3': 'Expunge Colorado',                     # pro bono record sealing
+    },
+    ('rent assistance', None): {
+        'd07a00973b16': 'Rent Assistance',
+        '0b411e735e5b': 'Karen Horgen Program',
+        '875a3615b524': 'Operation Homefront',
+        '715353de63c4': 'Colorado CARE Center',
+        'ec010d3cd6b7': 'Tri-Lakes Cares',
+        '2d3b3b9a08ad': 'Southern Colorado Health Network',
+        'bfb3273f5c02': 'West Side Cares',                      # rent/mortgage help
+        'bd85a58892b9': 'Office of Rental Assistance',
+        '17324063fa35': 'Rental Assistance list',
+        '9dd965fcc750': 'Emergency Rental Assistance Program',
+        '9248f9b189dc': 'Community Economic Defense Project',
+        '751bc0d8c270': 'CHFA SectionEight (Plus)',
+        '3edadf913f3d': "Charities' Hope",
+        'c34462075d6f': 'ESUSU',
+        '59d761d6d3cc': 'Colorado Division of Housing',         # housing vouchers
+        '1900a5d7fafa': 'Rocky Mountain Human Servicesw',
+    },
+    ('dental care', ('Medical',)): {
+        '46811d40550e': 'Community Dental Health',
+        '09ac48d72bba': 'Delta Dental',
+        '47e885901a53': 'Dental doctors',
+        '66777552988f': 'Senior Mobile Dental',
+        '04d1b06f103c': 'Stout Street Clinic',
+        'a83b4cf9ee1d': 'Trimble Charity Fund Through the Elks Foundation',
+        '67dca57349fc': 'Urban Peak',
+        'b50eec79bc56': 'Intervention, inc.',
+        'a5783067062f': 'SET Family Medical Clinics',
+        'e2d851130cc4': 'Mission Medical Center',               # dentistry
+        'f570e169eb30': 'SET Homeless Clinic',                  # teeth
+    },
+    ('ged', None): {
+        '14e92263de29': 'Career Online High School',
+        'd95d545b76c7': 'Community Connections Center (C-3)',
+        'b977e91a36b7': 'District 2 Adult Education',
+        '4c8209122bc0': 'GED Assistance: Lucero, Daissy',
+        '72bf6c0b50ea': 'Pikes Peak Library District-Adult Education',
+        'ec010d3cd6b7': 'Tri-Lakes Cares',
+        '841e014e67b5': 'Career One High School',               # high school diploma
+        '792216d03a24': 'project Diakonia',                     # adult basic education
+        'e45416bdbe90': 'Snap2Jobs (dba PrismXL)',              # adult basic education
+    },
+    ('utility bill help', None): {
+        '08c5b3c44f1c': 'Project Cope',
+        '8e6d6b319867': 'Lighten the Load',
+        '76ab37ce7122': 'Colorado School of Mines',
+        '2b5c65e9c789': 'Mountain View Electric Association',
+        '9c9e26304591': 'Public Utilities Commission Bills Program',
+        '352cf6f7030a': 'Cross Fire Ministries',
+        '6edcf4d81dd1': 'Helping Hands Act',
+        '0b411e735e5b': 'Karen Horgen Program',
+        '875a3615b524': 'Operation Homefront',
+        '2d3b3b9a08ad': 'Southern Colorado Health Network',
+        '3edadf913f3d': "Charities' Hope",
+        'bfb3273f5c02': 'West Side Cares',
+        '715353de63c4': 'Colorado CARE Center',
+        '959ac36564e9': 'Leap Low Income Energy Assistance Program',  # heating
+        '8b6bfcfa0687': 'Crisis Intervention Program',          # heating emergency, LEAP
+        '3a069d10edcb': 'Young Williams',                       # LIHEAP
+    },
+    ('transportation to medical appointments', None): {
+        'aeb7c8b23fd0': 'Disabled American Veterans',
+        '41ad0dac4d0c': 'Silver Key Senior Services',
+        'dde1f33d45cf': 'Mercy Medical Angels',
+        '4e5f67b5a5f9': 'Kador Transport (K.A. Dorman Ent.)',
+        '57d53b45a3aa': 'Medicare Transport',
+        'e9a79f6ec06b': 'Metro Caring',
+        'f50f6a6ec9ce': 'Medicaid Transport Reimbursement',
+        '72c9bc9c01b3': 'Medicare Bus Passes',
+        '4a3c055fcafc': 'Envida Cares',                         # medical rides
+        'eabca4987eed': 'Medicaid Rides',
+    },
+}
@@ -0,0 +1,264 @@
+"""
+Synthetic source sheets for benchmarking the consolidation pipeline.
+
+generate(out_dir, scale) writes every sheet the pipeline reads, in the same
+layouts as the shipped data, with `scale` times as many rows as the
+corresponding sheet in data/:
+
+  - Master-base.csv: the 6-column base snapshot, with header;
+  - the standard sheets in TAG_FILES: 5 columns (web and email share a
+    cell), with header;
+  - Weather-Shelter.csv: a threshold-note row and a column-name row, then
+    13 columns per shelter;
+  - Housing-Felon-Friendly.csv: a title row and a crime-category row, then a
+    multi-line name/address/phone/URL cell plus 15 policy columns;
+  - Jobs-Felon-Friendly.csv: a single column of employer names.
+
+Names are shared across sheets the way the real data shares them (most
+category-sheet rows name an organisation already in the base), details mix
+KEYWORD_TAGS keywords with untaggable text, and a small share of the base
+rows are near-duplicates for the fuzzy dedupe to find.  Output depends only
+on (scale, seed).
+
+    python benchmarks/synthetic.py OUT_DIR [--scale N] [--seed S]
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from consolidate.config import (  # noqa: E402
+    BASE_SHEET, DATA_DIR, HFF_CRIME_COLS, KEYWORD_TAGS, OUTPUT_COLS, TAG_FILES,
+)
+from consolidate.parsing import read_csv_raw  # noqa: E402
+
+STANDARD_HEADER = ['Name/Title', 'Ph. Number', 'Web Address/Email', 'Phys. Address',
+                   'Why would you contact them?']
+WS_HEADER = ['Name of Organization', 'County/Region', 'Activation Threshold', 'Phone',
+             'Email', 'Address', 'Hours of Operation', 'Population Served',
+             'Shelter or Motel Vouchers?', 'Reservation Required?', 'Pets allowed?',
+             'Website', 'Additional Notes']
+WS_NOTE = ('MOST SEVERE WEATHER IS ACTIVATED WHEN THE TEMPERATURES DROP TO 32 DEGREES '
+           'WITH PRECIPITATION OR 20 DEGREES')
+
+# Header/title rows before the data in each non-standard sheet
+HEADER_ROWS = {BASE_SHEET: 1, 'Weather-Shelter': 2, 'Housing-Felon-Friendly': 2,
+               'Jobs-Felon-Friendly': 0}
+
+PLACES = [
+    'Aspen', 'Pikes Peak', 'Front Range', 'Mountain View', 'Summit', 'Cedar Ridge',
+    'Columbine', 'Mesa', 'Arkansas Valley', 'Platte River', 'San Luis', 'Larimer',
+    'Boulder', 'Pueblo', 'Denver Metro', 'Grand Valley', 'Roaring Fork', 'Eagle',
+    'Weld', 'Sangre de Cristo', 'Four Corners', 'High Plains', 'Clear Creek',
+    'Gunnison', 'Routt', 'Fremont', 'Montrose', 'Delta', 'Elbert', 'Teller',
+]
+KINDS = [
+    'Community Services', 'Food Bank', 'Recovery Center', 'Housing Authority',
+    'Legal Aid', 'Health Clinic', 'Veterans Outreach', 'Family Resource Center',
+    'Senior Center', 'Youth Services', 'Transit', 'Workforce Center', 'Shelter',
+    'Pantry', 'Counseling', 'Benefits Office', 'Tribal Services', 'Pride Center',
+    'Learning Center', 'Mission',
+]
+EMPLOYER_WORDS = ['Summit', 'Peak', 'Valley', 'Alpine', 'Canyon', 'Frontier', 'Pioneer',
+                  'Granite', 'Evergreen', 'Blue Sky']
+EMPLOYER_KINDS = ['Logistics', 'Foods', 'Hardware', 'Airlines', 'Construction', 'Motors',
+                  'Staffing', 'Distribution', 'Manufacturing', 'Hospitality']
+CITIES = [('Denver', 80202), ('Colorado Springs', 80909), ('Pueblo', 81003),
+          ('Fort Collins', 80521), ('Grand Junction', 81501), ('Boulder', 80302),
+          ('Greeley', 80631), ('Durango', 81301), ('Alamosa', 81101), ('Lakewood', 80226)]
+STREETS = ['Main St', 'Colfax Ave', 'Academy Blvd', 'Uintah St', 'Pikes Peak Ave',
+           'Federal Blvd', 'Broadway', 'Hancock Expy', 'Santa Fe Dr', 'College Ave']
+AREA_CODES = ['303', '719', '970', '720']
+PLAIN_DETAILS = ['Call for more information', 'Walk-ins welcome during business hours',
+                 'Serves residents of the county', 'Appointments recommended',
+                 'Volunteer-run organization']
+QUALIFIERS = ['(sober living)', '(main office)', 'Inc']
+KEYWORDS = [kw for _, kws in KEYWORD_TAGS for kw in kws]
+
+
+def source_counts(data_dir=DATA_DIR):
+    """Return {sheet: data rows} for the sheets in data_dir (the 1x counts)."""
+    counts = {}
+    for fname in [BASE_SHEET, *TAG_FILES, 'Weather-Shelter', 'Housing-Felon-Friendly',
+                  'Jobs-Felon-Friendly']:
+        rows = [r for r in read_csv_raw(fname, data_dir) if r and r[0].strip()]
+        counts[fname] = max(len(rows) - HEADER_ROWS.get(fname, 1), 0)
+    return counts
+
+
+class Generator:
+    def __init__(self, seed=0):
+        self.rng = random.Random(seed)
+        self.next_id = 0
+
+    def new_name(self):
+        i = self.next_id
+        self.next_id += 1
+        name = f'{PLACES[i % len(PLACES)]} {KINDS[(i // len(PLACES)) % len(KINDS)]}'
+        n = i // (len(PLACES) * len(KINDS))
+        return f'{name} {n + 1}' if n else name
+
+    def phone(self):
+        rng = self.rng
+        if rng.random() < 0.15:
+            return ''
+        return f'{rng.choice(AREA_CODES)}-{rng.randint(200, 999)}-{rng.randint(0, 9999):04d}'
+
+    def url(self, name):
+        host = ''.join(c for c in name.lower() if c.isalnum())
+        return f'https://www.{host}.org/'
+
+    def email(self, name):
+        return f'info@{"".join(c for c in name.lower() if c.isalnum())}.org'
+
+    def web_cell(self, name):
+        """A combined web/email cell as people type them into the sheets."""
+        roll = self.rng.random()
+        if roll < 0.45:
+            return self.url(name)
+        if roll < 0.70:
+            return f'{self.url(name)}  {self.email(name)}'
+        if roll < 0.85:
+            return self.email(name)
+        if roll < 0.92:
+            return 'see website'
+        return ''
+
+    def address(self):
+        rng = self.rng
+        if rng.random() < 0.2:
+            return ''
+        city, zipcode = rng.choice(CITIES)
+        return f'{rng.randint(100, 9999)} {rng.choice(STREETS)}, {city}, CO {zipcode}'
+
+    def details(self):
+        rng = self.rng
+        if rng.random() < 0.25:
+            return rng.choice(PLAIN_DETAILS)
+        kws = rng.sample(KEYWORDS, rng.randint(1, 3))
+        return f'Provides {", ".join(kws)} support and referrals. {rng.choice(PLAIN_DETAILS)}.'
+
+    def base_rows(self, n):
+        rows = []
+        for _ in range(n):
+            if rows and self.rng.random() < 0.02:
+                # Near-duplicate of an earlier record: same phone, qualified name
+                name, phone, url, email, addr, details = self.rng.choice(rows)
+                rows.append([f'{name} {self.rng.choice(QUALIFIERS)}', phone, url, '', addr,
+                             details])
+                continue
+            name = self.new_name()
+            url = self.url(name) if self.rng.random() < 0.7 else ''
+            email = self.email(name) if self.rng.random() < 0.4 else ''
+            rows.append([name, self.phone(), url, email, self.address(), self.details()])
+        return rows
+
+    def standard_rows(self, n, pool):
+        rows = []
+        for _ in range(n):
+            # Most category-sheet rows name an organisation already in the base
+            name = self.rng.choice(pool) if pool and self.rng.random() < 0.85 else self.new_name()
+            rows.append([name, self.phone(), self.web_cell(name), self.address(),
+                         self.details()])
+        return rows
+
+    def weather_shelter_rows(self, n, pool):
+        rng = self.rng
+        rows = []
+        for _ in range(n):
+            name = rng.choice(pool) if pool and rng.random() < 0.5 else self.new_name()
+            city, _ = rng.choice(CITIES)
+            rows.append([
+                name, f'{city} County', 'Activated at 32°F with precipitation or 20°F',
+                self.phone(), self.email(name) if rng.random() < 0.3 else '',
+                self.address(), '7pm-7am', rng.choice(['Individuals', 'Families with Children']),
+                rng.choice(['Shelter', 'Motel Vouchers']), rng.choice(['Yes', 'No', 'NA']),
+                rng.choice(['Yes', 'No', 'NA']),
+                self.url(name) if rng.random() < 0.5 else '',
+                rng.choice(['', 'Individuals can walk-in', 'Call hotline first']),
+            ])
+        return rows
+
+    def housing_felon_friendly_rows(self, n, pool):
+        rng = self.rng
+        rows = []
+        for _ in range(n):
+            name = rng.choice(pool) if pool and rng.random() < 0.3 else self.new_name()
+            lines = [f'{name}  1b/1a ${rng.randint(700, 1600)}', self.address(), self.phone(),
+                     self.url(name) if rng.random() < 0.8 else '']
+            if rng.random() < 0.3:
+                lines.append('Background check required; call the leasing office')
+            cell = '\n'.join(line for line in lines if line)
+            policy = [rng.choice(['X', '', 'UNK', '?', 'All allowed'])
+                      for _ in HFF_CRIME_COLS]
+            rows.append([cell] + policy)
+        return rows
+
+    def jobs_felon_friendly_rows(self, n):
+        rows = []
+        for i in range(n):
+            name = (f'{EMPLOYER_WORDS[i % len(EMPLOYER_WORDS)]} '
+                    f'{EMPLOYER_KINDS[(i // len(EMPLOYER_WORDS)) % len(EMPLOYER_KINDS)]}')
+            k = i // (len(EMPLOYER_WORDS) * len(EMPLOYER_KINDS))
+            rows.append([f'{name} {k + 1}' if k else name])
+        return rows
+
+
+def _write(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerows(rows)
+
+
+def generate(out_dir, scale=1, seed=0, counts=None):
+    """Write synthetic sheets for `scale` × counts into out_dir; return {sheet: rows}."""
+    counts = counts or source_counts()
+    gen = Generator(seed)
+    os.makedirs(out_dir, exist_ok=True)
+    written = {}
+
+    def path(fname):
+        return os.path.join(out_dir, fname + '.csv')
+
+    base = gen.base_rows(counts[BASE_SHEET] * scale)
+    _write(path(BASE_SHEET), [OUTPUT_COLS[:6]] + base)
+    written[BASE_SHEET] = len(base)
+    pool = [row[0] for row in base]
+
+    for fname in TAG_FILES:
+        rows = gen.standard_rows(counts[fname] * scale, pool)
+        _write(path(fname), [STANDARD_HEADER] + rows)
+        written[fname] = len(rows)
+
+    rows = gen.weather_shelter_rows(counts['Weather-Shelter'] * scale, pool)
+    _write(path('Weather-Shelter'), [[WS_NOTE] + [''] * 12, WS_HEADER] + rows)
+    written['Weather-Shelter'] = len(rows)
+
+    rows = gen.housing_felon_friendly_rows(counts['Housing-Felon-Friendly'] * scale, pool)
+    _write(path('Housing-Felon-Friendly'),
+           [['Name of Apartments', 'X = category not allowed'] + [''] * 14,
+            ['[Addresses and contact info below each apt] '] + HFF_CRIME_COLS] + rows)
+    written['Housing-Felon-Friendly'] = len(rows)
+
+    rows = gen.jobs_felon_friendly_rows(counts['Jobs-Felon-Friendly'] * scale)
+    _write(path('Jobs-Felon-Friendly'), rows)
+    written['Jobs-Felon-Friendly'] = len(rows)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('out_dir')
+    parser.add_argument('--scale', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    written = generate(args.out_dir, args.scale, args.seed)
+    print(f'Wrote {sum(written.values())} rows across {len(written)} sheets '
+          f'to {args.out_dir}')
+
+
+if __name__ == '__main__':
+    main()
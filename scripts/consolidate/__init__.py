@@ -0,0 +1,18 @@
+"""
+Colorado Resources - Data Consolidation Pipeline
+Merges all CSVs into a clean Master.csv with:
+  - Name/Title, Phone, Web/Link, Email, Physical Address, Information/Details, Tags
+
+Importing this package has no side effects; call run() (or
+`python -m consolidate` from scripts/) to rebuild Master.csv.
+"""
+
+from .classify import classify_line, split_web_email
+from .parsing import normalize_name, auto_tag, read_standard_file
+from .pipeline import run, StageStats
+from .stages import STAGES, Build
+
+__all__ = [
+    'classify_line', 'split_web_email', 'normalize_name', 'auto_tag', 'read_standard_file',
+    'run', 'StageStats', 'STAGES', 'Build',
+]
@@ -0,0 +1,48 @@
+"""
+Command-line entry point.  From the scripts/ directory:
+
+    python -m consolidate [--incremental] [--jobs N] [--no-trace-memory]
+    python -m consolidate --low-memory
+    python -m consolidate --memo-cache
+    python -m consolidate --check-idempotent N
+"""
+
+import argparse
+import sys
+
+from .memo import MEMO_PATH
+from .pipeline import check_idempotent, run
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='consolidate',
+                                     description='Merge data/*.csv into data/Master.csv.')
+    parser.add_argument('--no-trace-memory', action='store_true',
+                        help='skip tracemalloc (faster, no peak-memory column)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='reparse only sheets whose content hash changed since the last run')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help='parse source sheets in N worker processes')
+    parser.add_argument('--low-memory', action='store_true',
+                        help='stream sheets through the merge instead of caching them')
+    parser.add_argument('--memo-cache', action='store_true',
+                        help='load and save the normalize/split memos under .cache/')
+    parser.add_argument('--check-idempotent', type=int, metavar='N',
+                        help='run N times and fail unless every output is byte-identical')
+    args = parser.parse_args(argv)
+    if args.low_memory and (args.incremental or args.jobs > 1):
+        parser.error('--low-memory cannot be combined with --incremental or --jobs')
+    if args.check_idempotent:
+        results = check_idempotent(args.check_idempotent)
+        for i, (size, digest) in enumerate(results, 1):
+            print(f'run {i}: {size} bytes  sha256 {digest[:16]}')
+        if len(set(results)) != 1:
+            sys.exit('Output changed between runs.')
+        print('Output is stable across runs.')
+        return
+    run(trace_memory=not args.no_trace_memory, incremental=args.incremental, jobs=args.jobs,
+        low_memory=args.low_memory, memo_path=MEMO_PATH if args.memo_cache else None)
+
+
+if __name__ == '__main__':
+    main()
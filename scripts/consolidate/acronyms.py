@@ -0,0 +1,86 @@
+"""
+Acronym expansion from data/Acronyms.csv ("Acronym, Spelled Out, Definition").
+
+The table maps each acronym, exactly as written, to its spelled-out form;
+rows without one, or whose acronym is not a single token ("DD
+Determination", "M1/2/3/4"), are skipped, and the first spelling of a
+repeated acronym wins.  expand() finds capitalized tokens with one regex
+pass and looks each up in a dict (a trailing plural "s" is tried second),
+so the cost per record depends on its length, not on the table size.
+Lookups are case-sensitive: "ACS" expands, "acs" does not.
+
+    expand('APS referral')            → 'Adult Protective Services referral'
+    expand('APS referral', keep=True) → 'APS (Adult Protective Services) referral'
+
+Names are expanded in place before duplicate keying; auto-tagging and
+search keep the acronym, since keywords like "ssi" name it directly.
+"""
+
+import csv
+import os
+import re
+
+from .config import ACRONYMS_SHEET, DATA_DIR
+
+ACRONYM_RE = re.compile(r'[A-Za-z][A-Za-z0-9]*(?:-[A-Za-z0-9]+)*')
+_CANDIDATE_RE = re.compile(r'\b[A-Z][A-Za-z0-9]*(?:-[A-Za-z0-9]+)*\b')
+
+
+class AcronymTable:
+    """Acronym → spelled-out form, with whole-token expansion of text."""
+
+    def __init__(self, expansions):
+        self.expansions = dict(expansions)
+
+    @classmethod
+    def from_csv(cls, path):
+        expansions = {}
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            rows = csv.reader(f)
+            next(rows, None)
+            for row in rows:
+                if len(row) < 2:
+                    continue
+                acronym, spelled = row[0].strip(), row[1].strip().lstrip('. ')
+                if spelled and ACRONYM_RE.fullmatch(acronym):
+                    expansions.setdefault(acronym, spelled)
+        return cls(expansions)
+
+    def __len__(self):
+        return len(self.expansions)
+
+    def lookup(self, token):
+        """Spelled-out form of token (or of its singular), or None."""
+        spelled = self.expansions.get(token)
+        if spelled is None and token.endswith('s'):
+            spelled = self.expansions.get(token[:-1])
+        return spelled
+
+    def expand(self, text, keep=False):
+        """Replace each acronym token in text with its spelled-out form.
+
+        keep=True writes "ACR (Spelled Out)" instead, keeping the acronym.
+        """
+        def replace(m):
+            token = m.group(0)
+            spelled = self.lookup(token)
+            if spelled is None:
+                return token
+            return f'{token} ({spelled})' if keep else spelled
+        return _CANDIDATE_RE.sub(replace, text) if self.expansions else text
+
+    def synonyms(self):
+        """Lowercase acronym → spelled-out form, for search indexes."""
+        return {acronym.lower(): spelled for acronym, spelled in sorted(self.expansions.items())}
+
+
+def acronyms_path(data_dir=DATA_DIR):
+    return os.path.join(data_dir, ACRONYMS_SHEET + '.csv')
+
+
+def load_acronyms(data_dir=DATA_DIR):
+    """Load the data directory's acronym table; empty when it has none."""
+    try:
+        return AcronymTable.from_csv(acronyms_path(data_dir))
+    except FileNotFoundError:
+        return AcronymTable({})
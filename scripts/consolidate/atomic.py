@@ -0,0 +1,41 @@
+"""
+Atomic file replacement: write to a temporary file in the target's
+directory, then rename it over the target, so readers never see a
+half-written file.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_path(path):
+    """Yield a temp file path next to path; on success rename it to path.
+
+    For writers that need a filename rather than a file object (sqlite3).
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                               prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    os.close(fd)
+    try:
+        yield tmp
+        # mkstemp creates 0600; give the file the permissions open() would
+        try:
+            os.chmod(tmp, os.stat(path).st_mode & 0o777)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp, 0o666 & ~umask)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+@contextmanager
+def atomic_open(path, mode='w', **kwargs):
+    """Open a temp file for writing; on success rename it to path."""
+    with atomic_path(path) as tmp:
+        with open(tmp, mode, **kwargs) as f:
+            yield f
@@ -0,0 +1,112 @@
+"""
+Stable record ids and the changelog between consecutive builds.
+
+Every record carries record_id(key), a short SHA-1 of its normalized name,
+in the "Record ID" column of Master.csv, so an organization keeps its id
+from one build to the next (a rename reads as a removal plus an addition).
+
+The Master.csv being replaced is read before the write stage; afterwards
+diff_builds() compares it with the new build.  Each side is one
+id → hash(row) dict, so added and removed ids are set differences and only
+rows whose hash changed are compared field by field: the work is linear in
+the record count.  Master.changes.json is written next to the build:
+
+    {
+      "version":  1,
+      "base":     sha256 of the Master.csv the changes apply to, or null,
+      "build":    sha256 of the Master.csv they produce,
+      "counts":   {"added": n, "removed": n, "merged": n, "modified": n,
+                   "unchanged": n},
+      "added":    [{"id": ..., "row": [Master.csv row]}, ...],
+      "removed":  [{"id": ..., "name": ...}, ...],
+      "merged":   [{"id": ..., "name": ..., "into": survivor id}, ...],
+      "modified": [{"id": ..., "name": ..., "changes": {column: [old, new]}}, ...]
+    }
+
+"merged" lists previous records that the dedupe stage folded into another
+record; each list is sorted by id.
+"""
+
+import csv
+import hashlib
+import json
+
+from .atomic import atomic_open
+from .config import OUTPUT_COLS
+from .incremental import file_digest
+from .parsing import normalize_name
+
+CHANGELOG_VERSION = 1
+ID_LEN = 12
+ID_COL = 'Record ID'
+CHANGE_KINDS = ('added', 'removed', 'merged', 'modified')
+
+
+def record_id(key):
+    """Stable id for a normalized name key."""
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:ID_LEN]
+
+
+def read_build(path):
+    """Return (sha256, header, {id: row}) of a published Master.csv, or None.
+
+    Builds from before the Record ID column get their ids from the names.
+    """
+    try:
+        f = open(path, newline='', encoding='utf-8')
+    except FileNotFoundError:
+        return None
+    with f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        id_col = header.index(ID_COL) if ID_COL in header else None
+        rows = {}
+        for row in reader:
+            rid = row[id_col] if id_col is not None else record_id(normalize_name(row[0]))
+            rows[rid] = row
+    return file_digest(path), header, rows
+
+
+def diff_builds(old_header, old_rows, new_rows, merged=None):
+    """Diff {id: row} builds; new rows are in OUTPUT_COLS order.
+
+    merged maps ids folded into another record to the survivor's id.
+    Columns that only one layout has are not compared.
+    """
+    merged = merged or {}
+    cols = [(col, old_header.index(col), OUTPUT_COLS.index(col))
+            for col in OUTPUT_COLS if col != ID_COL and col in old_header]
+    old_hash = {rid: hash(tuple(row[i] for _, i, _ in cols)) for rid, row in old_rows.items()}
+    new_hash = {rid: hash(tuple(row[j] for _, _, j in cols)) for rid, row in new_rows.items()}
+
+    diff = {kind: [] for kind in CHANGE_KINDS}
+    for rid in sorted(new_hash.keys() - old_hash.keys()):
+        diff['added'].append({'id': rid, 'row': new_rows[rid]})
+    for rid in sorted(old_hash.keys() - new_hash.keys()):
+        entry = {'id': rid, 'name': old_rows[rid][0]}
+        if rid in merged:
+            entry['into'] = merged[rid]
+            diff['merged'].append(entry)
+        else:
+            diff['removed'].append(entry)
+    unchanged = 0
+    for rid in sorted(new_hash.keys() & old_hash.keys()):
+        old, new = old_rows[rid], new_rows[rid]
+        if new_hash[rid] == old_hash[rid]:
+            unchanged += 1
+            continue
+        changes = {col: [old[i], new[j]] for col, i, j in cols if old[i] != new[j]}
+        diff['modified'].append({'id': rid, 'name': new[0], 'changes': changes})
+    diff['unchanged'] = unchanged
+    return diff
+
+
+def write_changelog(diff, base, build, path):
+    counts = {kind: len(diff[kind]) for kind in CHANGE_KINDS}
+    counts['unchanged'] = diff['unchanged']
+    changelog = {'version': CHANGELOG_VERSION, 'base': base, 'build': build, 'counts': counts}
+    changelog.update((kind, diff[kind]) for kind in CHANGE_KINDS)
+    with atomic_open(path, 'w', encoding='utf-8') as f:
+        json.dump(changelog, f, ensure_ascii=False, separators=(',', ':'))
+        f.write('\n')
+    return changelog
@@ -0,0 +1,66 @@
+"""
+Cell and line classification shared by the sheet readers.
+
+classify_line() labels one line of a free-text cell as a phone, URL, email,
+address or note; split_web_email() splits a combined web/email cell.  Both
+use precompiled patterns and only run a regex once a cheap substring test
+shows it can match (URL_RE needs 'http://', 'https://' or 'www.', EMAIL_RE
+needs '@', PHONE_RE and addresses need a run of three digits), so a typical
+note line costs a single regex search.
+"""
+
+import re
+
+from .config import EMAIL_RE, URL_RE, PHONE_RE
+from .memo import memoize
+
+PHONE, URL, EMAIL, ADDRESS, NOTE = 'phone', 'url', 'email', 'address', 'note'
+
+DIGITS_RE       = re.compile(r'\d{3,}')
+ADDRESS_HINT_RE = re.compile(r'st|ave|blvd|dr|ln|rd|way|co |colorado')
+NAME_NOTE_RE    = re.compile(r'\s{2,}|\$|\bfor\b')  # where a name's price/notes begin
+
+
+def has_url(text):
+    return ('http://' in text or 'https://' in text or 'www.' in text) \
+        and URL_RE.search(text) is not None
+
+
+def classify_line(line, url_seen=False):
+    """Label a stripped line; url_seen says whether an earlier line was a URL.
+
+    Precedence: phone (unless a URL was seen or the line has a scheme),
+    then URL, email, address (3+ digits plus a street/state hint), note.
+    """
+    digits = DIGITS_RE.search(line) is not None
+    if (digits and not url_seen and 'http://' not in line and 'https://' not in line
+            and PHONE_RE.search(line)):
+        return PHONE
+    if has_url(line):
+        return URL
+    if '@' in line and EMAIL_RE.search(line):
+        return EMAIL
+    if digits and ADDRESS_HINT_RE.search(line.lower()):
+        return ADDRESS
+    return NOTE
+
+
+@memoize(8192, depends=(EMAIL_RE, URL_RE))
+def split_web_email(raw):
+    """Split a combined web/email cell into (url, email) strings."""
+    raw = raw.strip()
+    emails = EMAIL_RE.findall(raw) if '@' in raw else []
+    urls   = URL_RE.findall(raw) if ('http' in raw or 'www.' in raw) else []
+    # Clean trailing punctuation from URLs
+    urls = [u.rstrip('.,;)>') for u in urls]
+    email = '; '.join(emails) if emails else ''
+    url   = '; '.join(urls)   if urls   else ''
+    # If nothing matched but there's text, keep it in url field as-is
+    if not email and not url and raw:
+        url = raw
+    return url, email
+
+
+def split_name_note(name_raw):
+    """Strip trailing price notes like "$995" or "for 1b/1a" from a name line."""
+    return NAME_NOTE_RE.split(name_raw, 1)[0].strip().rstrip('-').strip()
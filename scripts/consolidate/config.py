@@ -0,0 +1,90 @@
+"""
+Shared constants for the consolidation pipeline: paths, field regexes,
+output columns, tag files and keyword → tag rules.
+"""
+
+import os
+import re
+
+DATA_DIR  = os.path.join(os.path.dirname(__file__), '..', '..', 'data')
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', '.cache', 'consolidate')
+
+EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}')
+URL_RE   = re.compile(r'https?://\S+|www\.\S+')
+PHONE_RE = re.compile(r'(\(?\d{3}\)?[\s.\-]?\d{3}[\s.\-]?\d{4})')
+
+PLACEHOLDER_NAMES = {'harry potter', 'name/title', 'name of organization', 'name',
+                     '[addresses and contact info below each apt] '}
+
+# Hand-maintained base records; Master.csv is output only
+BASE_SHEET = 'Master-base'
+
+# Acronym → spelled-out table; read for expansion, not as a record source
+ACRONYMS_SHEET = 'Acronyms'
+
+OUTPUT_COLS = ['Name/Title', 'Phone', 'Web/Link', 'Email',
+               'Physical Address', 'Information/Details', 'Tags', 'Latitude', 'Longitude',
+               'Record ID']
+
+# ── Tag files (standard 5-col format) ────────────────────────────────────────
+TAG_FILES = [
+    'Benefits', 'Education', 'Elderly', 'Employment', 'Food',
+    'LGBTQ', 'Legal', 'Medical', 'Native-Indigenous',
+    'Resource-Databases', 'Rural', 'SO', 'Transportation',
+    'Unknown', 'Veterans', 'Youth-and-Family',
+]
+
+# ── Keyword → tag auto-assignment ────────────────────────────────────────────
+KEYWORD_TAGS = [
+    ('Veterans',          ['veteran', 'military', 'soldier', 'armed force', 'navy', 'army',
+                           'air force', 'marine', 'va benefit', 'va health', 'va service']),
+    ('Food',              ['food', 'nutrition', 'meal', 'pantry', 'snap', 'hunger',
+                           'grocery', 'wic', 'food bank', 'food shelf', 'feeding']),
+    ('Housing',           ['housing', 'shelter', 'homeless', 'apartment', 'rent',
+                           'evict', 'lodging', 'transitional living', 'sober living',
+                           'residential']),
+    ('Medical',           ['medical', 'health', 'clinic', 'doctor', 'hospital',
+                           'therapy', 'counseling', 'treatment', 'substance',
+                           'addiction', 'recovery', 'rehab', 'dental', 'pharmacy',
+                           'prescription', 'mental health', 'psychiatric', 'behavioral',
+                           'medication']),
+    ('Education',         ['education', 'school', 'college', 'training', 'ged',
+                           'learn', 'degree', 'class', 'academic', 'literacy', 'tutor']),
+    ('Employment',        ['employ', 'job', 'work', 'career', 'resume', 'hire',
+                           'labor', 'vocational', 'workforce', 'occupation']),
+    ('Legal',             ['legal', 'attorney', 'lawyer', 'court', ' law ', 'criminal',
+                           'arrest', 'custody', 'rights', 'domestic violence',
+                           'advocacy', 'paralegal']),
+    ('Benefits',          ['benefit', 'medicaid', 'medicare', 'ssi', 'ssdi',
+                           'financial assistance', 'tanf', 'government assistance',
+                           'cash assistance', 'insurance']),
+    ('Youth-and-Family',  ['youth', 'child', 'family', 'parent', 'kid', 'teen',
+                           'adolescent', 'foster', 'juvenile', 'newborn', 'infant',
+                           'baby', 'parenting']),
+    ('Elderly',           ['elder', 'senior', 'aging', 'older adult', 'geriatric',
+                           'assisted living', 'long-term care', 'memory care']),
+    ('LGBTQ',             ['lgbt', 'gay', 'lesbian', 'transgender', 'bisexual',
+                           'queer', 'non-binary', 'nonbinary']),
+    ('Native-Indigenous', ['native', 'indigenous', 'tribal', 'indian tribe',
+                           'first nation']),
+    ('Transportation',    ['transport', 'bus', 'ride', 'car', 'vehicle',
+                           'drive', 'transit', 'mobility']),
+    ('Rural',             ['rural', 'frontier county']),
+    ('SO',                ['sex offender', 'sex offense', 'registry', 'so list',
+                           'sexual offense']),
+]
+
+# ── Every tag the pipeline can assign; a record's tags are a bitmask over this ─
+KNOWN_TAGS = TAG_FILES + [
+    'Housing', 'Weather-Shelter', 'Housing-Felon-Friendly', 'Jobs-Felon-Friendly',
+    'Uncategorized',
+]
+KNOWN_TAGS += [tag for tag, _ in KEYWORD_TAGS if tag not in KNOWN_TAGS]
+
+# ── Housing-Felon-Friendly crime columns (row 1, indices 1-15) ───────────────
+HFF_CRIME_COLS = [
+    'Sex Offenses', 'Violence Against Other Person', 'Destruction of Property',
+    'Controlled Substance', 'Manuf Controlled Substance', 'Arson',
+    'Lifetime Sex Offender Registry', 'Sex Crimes Last 5 Years', 'On Any SO List',
+    'Medicaid', 'Private Pay', 'Medicare', 'M/F/A', 'Children Allowed', 'Pets Allowed',
+]
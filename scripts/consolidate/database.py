@@ -0,0 +1,135 @@
+"""
+SQLite export of the published records (Master.sqlite next to Master.csv).
+
+    resources      (id, name, phone, web, email, address, details,
+                    latitude, longitude,     id = row position in Master.csv,
+                    record_id)               record_id = its stable Record ID
+    tags           (id, name)
+    resource_tags  (tag_id, resource_id)     primary key, plus an index on
+                                             resource_id
+    resources_fts  FTS5 over resources.name and resources.details
+    synonyms       (term, expansion)         acronym → spelled-out form, for
+                                             rewriting FTS queries
+
+Tag filters and text search are indexed lookups, e.g.
+
+    SELECT r.* FROM resources r
+      JOIN resource_tags rt ON rt.resource_id = r.id
+      JOIN tags t ON t.id = rt.tag_id
+     WHERE t.name = 'Food';
+
+    SELECT r.* FROM resources_fts f JOIN resources r ON r.id = f.rowid
+     WHERE resources_fts MATCH 'food pantry' ORDER BY f.rank;
+
+The database is written into a temp file in one transaction and renamed
+into place; validate_database() checks it against the CSV.  It is a local
+export for ad-hoc queries and is not committed (the web app reads the CSV
+and the JSON artifacts); run the pipeline to build it.
+"""
+
+import csv
+import sqlite3
+
+from .atomic import atomic_path
+from .config import OUTPUT_COLS
+from .record import tag_names
+
+SCHEMA_VERSION = 3
+
+SCHEMA = '''
+CREATE TABLE resources (
+    id        INTEGER PRIMARY KEY,
+    name      TEXT NOT NULL,
+    phone     TEXT NOT NULL,
+    web       TEXT NOT NULL,
+    email     TEXT NOT NULL,
+    address   TEXT NOT NULL,
+    details   TEXT NOT NULL,
+    latitude  REAL,
+    longitude REAL,
+    record_id TEXT NOT NULL UNIQUE
+);
+CREATE TABLE tags (
+    id   INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE resource_tags (
+    tag_id      INTEGER NOT NULL REFERENCES tags(id),
+    resource_id INTEGER NOT NULL REFERENCES resources(id),
+    PRIMARY KEY (tag_id, resource_id)
+) WITHOUT ROWID;
+CREATE INDEX resource_tags_resource ON resource_tags(resource_id);
+CREATE INDEX resources_name ON resources(name COLLATE NOCASE);
+CREATE TABLE synonyms (
+    term      TEXT PRIMARY KEY,
+    expansion TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE resources_fts USING fts5(
+    name, details, content='resources', content_rowid='id'
+);
+'''
+
+
+def write_database(sorted_records, path, synonyms=None):
+    """Write sorted_records (in Master.csv order) to a new database at path.
+
+    synonyms maps lowercase acronyms to their spelled-out forms.
+    """
+    tags = sorted({t for rec in sorted_records for t in tag_names(rec.tags)})
+    tag_ids = {t: i for i, t in enumerate(tags)}
+    with atomic_path(path) as tmp:
+        conn = sqlite3.connect(tmp, isolation_level=None)
+        try:
+            # A fresh temp file: skip the journal, the rename is the real commit
+            conn.execute('PRAGMA journal_mode = OFF')
+            conn.execute('PRAGMA synchronous = OFF')
+            conn.executescript('BEGIN;' + SCHEMA)
+            conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            conn.executemany('INSERT INTO tags VALUES (?, ?)', enumerate(tags))
+            conn.executemany('INSERT INTO synonyms VALUES (?, ?)', (synonyms or {}).items())
+            conn.executemany(
+                'INSERT INTO resources VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                ((rid, rec.name, rec.phone, rec.url, rec.email, rec.address, rec.details,
+                  rec.lat, rec.lon, rec.uid) for rid, rec in enumerate(sorted_records)))
+            conn.executemany(
+                'INSERT INTO resource_tags VALUES (?, ?)',
+                ((tag_ids[t], rid) for rid, rec in enumerate(sorted_records)
+                 for t in tag_names(rec.tags)))
+            conn.execute("INSERT INTO resources_fts(resources_fts) VALUES ('rebuild')")
+            conn.execute('COMMIT')
+        finally:
+            conn.close()
+
+
+def validate_database(db_path, csv_path):
+    """Raise ValueError unless the database holds exactly the CSV's records and tags."""
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    if rows[0] != OUTPUT_COLS:
+        raise ValueError(f'{csv_path}: unexpected header {rows[0]}')
+    rows = rows[1:]
+    tag_col = OUTPUT_COLS.index('Tags')
+    row_tags = [row[tag_col].split('; ') if row[tag_col] else [] for row in rows]
+    expected = {
+        'resources':     len(rows),
+        'tags':          len({t for tags in row_tags for t in tags}),
+        'resource_tags': sum(map(len, row_tags)),
+        'resources_fts': len(rows),
+    }
+
+    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    try:
+        if conn.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+            raise ValueError(f'{db_path}: unexpected schema version')
+        for table, count in expected.items():
+            found = conn.execute(f'SELECT count(*) FROM {table}').fetchone()[0]
+            if found != count:
+                raise ValueError(f'{table} has {found} rows, {csv_path} implies {count}')
+        if conn.execute('PRAGMA foreign_key_check').fetchall():
+            raise ValueError(f'{db_path}: resource_tags references missing rows')
+        id_col = OUTPUT_COLS.index('Record ID')
+        found = conn.execute('SELECT name, record_id FROM resources ORDER BY id').fetchall()
+        if found != [(row[0], row[id_col]) for row in rows]:
+            raise ValueError(f'{db_path}: resource names or ids differ from {csv_path}')
+    finally:
+        conn.close()
@@ -0,0 +1,197 @@
+"""
+Fuzzy duplicate detection across normalized-name keys.
+
+Exact keys miss variants such as "Aspen Ridge Recovery" vs "Aspen Ridge
+Recovery (sober living)".  Instead of comparing every pair, each record is
+filed under a few cheap blocking keys (its core name tokens, phone digits
+and web host) and only records sharing a block are compared.  Blocks
+larger than MAX_BLOCK (a switchboard number, a shared host) are skipped, so
+the number of comparisons grows roughly linearly with the record count.
+
+Names are fingerprinted with their acronyms spelled out, so "APS" and
+"Adult Protective Services" share core tokens.
+
+Two records are duplicates when either
+  - their core name tokens are identical, their parenthetical qualifiers
+    do not disagree, and neither their phones nor their hosts disagree; or
+  - they share a phone number or web host and their core name tokens
+    have a Jaccard similarity of at least MIN_JACCARD.
+
+Matches join clusters only when no record of one cluster conflicts with
+a record of the other (disagreeing qualifiers, phones or hosts), so
+"Salvation Army" cannot chain "(Pueblo)" and "(Denver)" together.
+
+merge_into() keeps the survivor's usable values, takes the duplicate's
+where the survivor's are empty or flagged by validation, appends details
+it does not already have, and returns whatever it dropped for the review
+report.
+"""
+
+import re
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+from .config import PHONE_RE, URL_RE
+from .record import UNCATEGORIZED, Record
+from .validate import usable
+
+MAX_BLOCK = 25
+MIN_JACCARD = 0.8
+
+NAME_STOPWORDS = {'a', 'an', 'the', 'of', 'and', 'for', 'inc', 'llc'}
+FIELDS = ('Phone', 'Web/Link', 'Email', 'Physical Address', 'Information/Details')
+CONTACT_FIELDS = FIELDS[:-1]
+
+_PAREN_RE = re.compile(r'\(([^)]*)\)')
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def fingerprint(rec, acronyms=None):
+    """Return (core tokens, qualifiers, phone digits, host) for a record."""
+    name = (acronyms.expand(rec.name) if acronyms else rec.name).lower()
+    qualifiers = frozenset(q.strip() for q in _PAREN_RE.findall(name) if q.strip())
+    tokens = frozenset(t for t in _TOKEN_RE.findall(_PAREN_RE.sub(' ', name))
+                       if t not in NAME_STOPWORDS)
+    phones = frozenset(re.sub(r'\D', '', p) for p in PHONE_RE.findall(rec.phone))
+    host = ''
+    m = URL_RE.search(rec.url)
+    if m:
+        url = m.group(0)
+        host = urlsplit(url if '://' in url else 'http://' + url).netloc.lower()
+        host = host.removeprefix('www.').rstrip('.,;)>')
+    return tokens, qualifiers, phones, host
+
+
+def blocking_keys(fp):
+    tokens, _, phones, host = fp
+    keys = []
+    if tokens:
+        keys.append(('name', tokens))
+    keys.extend(('phone', p) for p in phones)
+    if host:
+        keys.append(('host', host))
+    return keys
+
+
+def match_rule(a, b):
+    """Return the rule under which fingerprints a and b match, or None."""
+    tokens_a, quals_a, phones_a, host_a = a
+    tokens_b, quals_b, phones_b, host_b = b
+    if not tokens_a or not tokens_b:
+        return None
+    shared_phone = bool(phones_a & phones_b)
+    shared_host = bool(host_a and host_a == host_b)
+    if tokens_a == tokens_b:
+        if quals_a and quals_b and quals_a != quals_b:
+            return None  # e.g. "(North)" vs "(South)" branches
+        conflict = ((phones_a and phones_b and not shared_phone)
+                    or (host_a and host_b and not shared_host))
+        return None if conflict else 'same-name'
+    if shared_phone or shared_host:
+        jaccard = len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+        if jaccard >= MIN_JACCARD:
+            return 'shared-phone' if shared_phone else 'shared-host'
+    return None
+
+
+def conflicts(a, b):
+    """True if fingerprints a and b cannot belong to one organization."""
+    _, quals_a, phones_a, host_a = a
+    _, quals_b, phones_b, host_b = b
+    return bool((quals_a and quals_b and quals_a != quals_b)
+                or (phones_a and phones_b and not phones_a & phones_b)
+                or (host_a and host_b and host_a != host_b))
+
+
+def field_usable(rec, field):
+    return usable(Record.COLUMN_ATTRS[field], rec[field])
+
+
+def completeness(rec):
+    """Fields holding a value validation would not clear or flag."""
+    return sum(1 for field in FIELDS if field_usable(rec, field))
+
+
+def find_duplicates(records, acronyms=None):
+    """Return [(survivor_key, [(dup_key, rule), ...])] for records (key → rec)."""
+    keys = sorted(records, key=lambda k: (records[k].name.lower(), k))
+    fps = {k: fingerprint(records[k], acronyms) for k in keys}
+
+    blocks = defaultdict(list)
+    for k in keys:
+        for bk in blocking_keys(fps[k]):
+            blocks[bk].append(k)
+
+    parent = {k: k for k in keys}
+    cluster = {k: [k] for k in keys}  # root → its members
+
+    def find(k):
+        while parent[k] != k:
+            parent[k] = parent[parent[k]]
+            k = parent[k]
+        return k
+
+    rules = {}
+    seen = set()
+    for members in blocks.values():
+        if len(members) < 2 or len(members) > MAX_BLOCK:
+            continue
+        for i, a in enumerate(members):
+            for b in members[i + 1:]:
+                if (a, b) in seen:
+                    continue
+                seen.add((a, b))
+                rule = match_rule(fps[a], fps[b])
+                if not rule:
+                    continue
+                ra, rb = find(a), find(b)
+                if ra == rb or any(conflicts(fps[x], fps[y]) and not match_rule(fps[x], fps[y])
+                                   for x in cluster[ra] for y in cluster[rb]):
+                    continue
+                rules.setdefault(a, rule)
+                rules.setdefault(b, rule)
+                root, other = min(ra, rb), max(ra, rb)
+                parent[other] = root
+                cluster[root].extend(cluster.pop(other))
+
+    clusters = defaultdict(list)
+    for k in keys:
+        clusters[find(k)].append(k)
+
+    groups = []
+    for members in clusters.values():
+        if len(members) < 2:
+            continue
+        # Keep the most complete record; ties go to the earlier name.
+        members.sort(key=lambda k: -completeness(records[k]))
+        survivor, dups = members[0], members[1:]
+        groups.append((survivor, [(k, rules[k]) for k in dups]))
+    return groups
+
+
+def merge_into(survivor, dup):
+    """Merge dup into survivor; return the [(field, value)] that were dropped.
+
+    Tags are unioned.  A contact field takes dup's value when the survivor's
+    is empty, or flagged while dup's is usable; otherwise a value of dup the
+    survivor does not already contain is dropped.  dup's details are
+    appended unless already present.
+    """
+    survivor.tags |= dup.tags
+    if survivor.tags != UNCATEGORIZED:
+        survivor.tags &= ~UNCATEGORIZED
+    dropped = []
+    for field in CONTACT_FIELDS:
+        mine, theirs = survivor[field], dup[field]
+        if not theirs or theirs in mine:
+            continue
+        if not mine:
+            survivor[field] = theirs
+        elif field_usable(dup, field) and not field_usable(survivor, field):
+            dropped.append((field, mine))
+            survivor[field] = theirs
+        else:
+            dropped.append((field, theirs))
+    if dup.details and dup.details not in survivor.details:
+        survivor.details = (survivor.details + ' | ' + dup.details).strip(' | ')
+    return dropped
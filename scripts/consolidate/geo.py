@@ -0,0 +1,170 @@
+"""
+Offline geocoding of Physical Address values and a grid index for
+"nearest resources" queries.
+
+geocode() finds a Colorado ZIP code or place name in a free-text address
+and resolves it against co_places.csv, a bundled table of place centroids.
+Each place lists the ZIP codes it covers: exact codes, ranges
+("80010-80019") and three-digit prefixes, which are only a fallback for
+codes not listed exactly.  Precision is therefore the place centroid, not
+the street address.  There are no network calls.
+
+Multi-site values ("...; Fountain CO 80817") resolve to their first
+resolvable part, and within a part the last place name wins, as the city
+follows the street.  A part with neither a ZIP code nor a street number
+that mentions two or more distinct places ("Denver, Pueblo", "Mesa,
+Montrose, Delta, & Ouray Counties") lists a service area, not a site, and
+is left unresolved.  A place name counts only when it ends a part or is
+followed by a comma, "CO"/"Colorado" or a separator, and not when it is
+followed by another state's code.  So "Evans St", "Denver VA Therapeutic
+Program" and "Aurora, IL" do not resolve.  Places that are also common
+words (AMBIGUOUS_PLACES: "Center", "Golden", ...) need the "CO" after them.
+
+GeoIndex buckets records into GRID_DEGREES cells, grouped by location
+within a cell.  nearest() only visits the cells that can hold a point
+within the requested radius, and it computes one distance per distinct
+location, not per record.
+"""
+
+import csv
+import math
+import os
+import re
+from collections import defaultdict
+from functools import lru_cache
+
+from .record import tags_mask
+
+PLACES_PATH = os.path.join(os.path.dirname(__file__), 'co_places.csv')
+
+EARTH_RADIUS_MILES = 3958.8
+GRID_DEGREES = 0.25
+
+# Colorado ZIP codes all start 800-816; the last one in a part wins, so a
+# leading street number such as "8000 W Colfax Ave" is not taken for a ZIP.
+ZIP_RE = re.compile(r'(?<!\d)(8[01]\d{3})(?:-\d{4})?(?!\d)')
+STREET_RE = re.compile(r'(?<![\w/])\d{1,6}\b')
+PLACE_ALIASES = {
+    'c/s': 'Colorado Springs', 'cos': 'Colorado Springs', 'co springs': 'Colorado Springs',
+    'colo springs': 'Colorado Springs', 'ft. collins': 'Fort Collins',
+    'ft collins': 'Fort Collins', 'cañon city': 'Canon City', 'ft. carson': 'Fort Carson',
+    'ft carson': 'Fort Carson', 'ft. morgan': 'Fort Morgan', 'ft morgan': 'Fort Morgan',
+}
+AMBIGUOUS_PLACES = {
+    'Center', 'Golden', 'Superior', 'Divide', 'Cascade', 'Eagle', 'Delta', 'Evans',
+    'Hudson', 'Mead', 'Agate', 'Genoa', 'Florence', 'Elizabeth', 'Columbine', 'Vail',
+    'Frederick',
+}
+# Group 2 is set when the name is followed by "CO"/"Colorado"
+_PLACE_END = r'(?=(\s*,?\s*(?:co|colorado)\b)|\s*(?:$|[;/&(]|,(?!\s*[a-z]{2}\b)))'
+
+
+@lru_cache(maxsize=None)
+def load_places(path=PLACES_PATH):
+    """Return (place → (lat, lon), ZIP → place, ZIP prefix → place, place regexes).
+
+    The regexes are (place names that can end an address, any mention of a
+    place name, lowercase name → place).
+    """
+    coords, zips, prefixes = {}, {}, {}
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            place = row['Place']
+            coords[place] = (float(row['Latitude']), float(row['Longitude']))
+            for token in row['ZIPs'].split():
+                if len(token) == 3:
+                    prefixes[token] = place
+                    continue
+                first, _, last = token.partition('-')
+                for code in range(int(first), int(last or first) + 1):
+                    zips[str(code)] = place
+    names = {name.lower(): name for name in coords}
+    names.update(PLACE_ALIASES)
+    alternation = '|'.join(re.escape(n) for n in sorted(names, key=len, reverse=True))
+    pattern = re.compile(rf'(?<![\w/])({alternation}){_PLACE_END}')
+    mentions = re.compile(rf'(?<!\w)({alternation})(?!\w)')
+    return coords, zips, prefixes, (pattern, mentions, names)
+
+
+def resolve_part(part):
+    """Return the place named by one address part, or None."""
+    coords, zips, prefixes, (pattern, mentions, names) = load_places()
+    codes = ZIP_RE.findall(part)
+    if codes:
+        code = codes[-1]
+        place = zips.get(code) or prefixes.get(code[:3])
+        if place:
+            return place
+    lowered = part.lower()
+    if not codes and not STREET_RE.search(lowered):
+        if len({names[m.group(1)] for m in mentions.finditer(lowered)}) > 1:
+            return None
+    place = None
+    for m in pattern.finditer(lowered):
+        name = names[m.group(1)]
+        if m.group(2) or name not in AMBIGUOUS_PLACES:
+            place = name
+    return place
+
+
+def geocode(address):
+    """Return (place, lat, lon) for a free-text address, or None."""
+    for part in address.split(';'):
+        place = resolve_part(part.strip())
+        if place:
+            lat, lon = load_places()[0][place]
+            return place, lat, lon
+    return None
+
+
+def distance_miles(lat1, lon1, lat2, lon2):
+    """Great-circle (haversine) distance in miles."""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(a))
+
+
+def _cell(lat, lon):
+    return int(math.floor(lat / GRID_DEGREES)), int(math.floor(lon / GRID_DEGREES))
+
+
+class GeoIndex:
+    """Grid index over (record id, lat, lon, tag mask) points."""
+
+    def __init__(self, points):
+        self.grid = defaultdict(lambda: defaultdict(list))  # cell → (lat, lon) → [(id, tags)]
+        for rid, lat, lon, tags in points:
+            self.grid[_cell(lat, lon)][lat, lon].append((rid, tags))
+
+    @classmethod
+    def from_csv(cls, path):
+        """Index the rows of a published Master.csv that carry coordinates."""
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = csv.DictReader(f)
+            points = [(rid, float(row['Latitude']), float(row['Longitude']),
+                       tags_mask(row['Tags'].split('; ') if row['Tags'] else ()))
+                      for rid, row in enumerate(rows) if row['Latitude']]
+        return cls(points)
+
+    def nearest(self, lat, lon, k=10, miles=25.0, tags=None):
+        """Return up to k (distance, record id) within miles, nearest first.
+
+        tags keeps records carrying at least one of the given tags; ties
+        keep row order.
+        """
+        want = tags_mask(tags) if tags else 0
+        dlat = miles / 69.0
+        dlon = miles / (69.0 * max(math.cos(math.radians(lat)), 0.01))
+        lat0, lon0 = _cell(lat - dlat, lon - dlon)
+        lat1, lon1 = _cell(lat + dlat, lon + dlon)
+        found = []
+        for i in range(lat0, lat1 + 1):
+            for j in range(lon0, lon1 + 1):
+                for (plat, plon), members in self.grid.get((i, j), {}).items():
+                    d = distance_miles(lat, lon, plat, plon)
+                    if d <= miles:
+                        found.extend((d, rid) for rid, ptags in members
+                                     if not want or ptags & want)
+        found.sort()
+        return found[:k]
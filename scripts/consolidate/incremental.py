@@ -0,0 +1,103 @@
+"""
+Content-hash manifest for incremental runs.
+
+The manifest remembers, per source sheet, its SHA-256 and parsed entries,
+plus the finished record for every normalized-name key.  A record depends
+only on the entries that share its key, so after a sheet changes it is
+enough to reparse that sheet and rebuild the keys it had before or has now;
+every other record is carried over unchanged.
+
+The manifest is keyed by a digest of this package's source, so editing
+the pipeline itself invalidates it and forces a full rebuild.  Records
+also depend on the acronym table (auto-tagging, dedupe), so a change to
+Acronyms.csv does the same.
+"""
+
+import glob
+import hashlib
+import os
+import pickle
+
+from .acronyms import acronyms_path
+from .atomic import atomic_open
+from .config import CACHE_DIR
+from .parsing import SOURCES, normalize_name
+
+MANIFEST_PATH = os.path.join(CACHE_DIR, 'manifest.pickle')
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def code_digest():
+    """Digest of the pipeline's own source files."""
+    h = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(os.path.dirname(__file__), '*.py'))):
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def acronyms_digest(data_dir):
+    path = acronyms_path(data_dir)
+    return file_digest(path) if os.path.exists(path) else None
+
+
+def source_digests(data_dir):
+    return {fname: file_digest(os.path.join(data_dir, fname + '.csv')) for fname in SOURCES}
+
+
+def load_manifest(data_dir, path=MANIFEST_PATH):
+    """Return the stored manifest if it is usable for data_dir, else None."""
+    try:
+        with open(path, 'rb') as f:
+            manifest = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+    if (manifest.get('code') != code_digest()
+            or manifest.get('data_dir') != os.path.abspath(data_dir)
+            or manifest.get('acronyms') != acronyms_digest(data_dir)):
+        return None
+    return manifest
+
+
+def save_manifest(build, digests, path=MANIFEST_PATH):
+    """Persist digests, parsed entries and finished records."""
+    manifest = {
+        'code':     code_digest(),
+        'data_dir': os.path.abspath(build.data_dir),
+        'acronyms': acronyms_digest(build.data_dir),
+        'files':    {fname: {'sha256': digests[fname], 'entries': build.parsed[fname]}
+                     for fname in SOURCES},
+        'records':  build.keyed,
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with atomic_open(path, 'wb') as f:
+        pickle.dump(manifest, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def plan(build, manifest, digests):
+    """Seed build from manifest; return the list of changed source names.
+
+    Unchanged sheets get their cached entries and changed ones are left for
+    the parse stage.  The keys changed sheets used to contain become the
+    build scope (the parse stage adds the keys they contain now), and every
+    other finished record is carried over.
+    """
+    changed = [f for f in SOURCES
+               if manifest['files'].get(f, {}).get('sha256') != digests[f]]
+    affected = set()
+    for fname in SOURCES:
+        cached = manifest['files'].get(fname, {}).get('entries', [])
+        if fname in changed:
+            affected.update(normalize_name(e.name) for e in cached)
+        else:
+            build.parsed[fname] = cached
+    build.scope = affected
+    build.carried = {k: rec for k, rec in manifest['records'].items() if k not in affected}
+    return changed
@@ -0,0 +1,101 @@
+"""
+Prebuilt JSON index published next to Master.csv.
+
+Layout of Master.index.json (compact, keys sorted, UTF-8):
+
+    {
+      "version": 2,
+      "columns": ["Name/Title", ..., "Information/Details", "Record ID"],
+      "tags":    ["Benefits", ...],              # tag id → name
+      "records": [[name, phone, ..., details, record id, [tag ids]], ...],
+      "by_tag":  {"Food": [rows], ...},
+      "tokens":  {"pantry": [rows], ...}         # name + details tokens
+    }
+
+Rows are positions in Master.csv (header excluded) and in "records", so
+consumers can load one file instead of parsing the CSV.  Rows shift
+between builds; the Record ID column (changelog.record_id) does not, so
+it is what consumers should keep.  validate_index() re-reads both files
+and checks they describe the same records.
+"""
+
+import csv
+import json
+import re
+from collections import defaultdict
+
+from .atomic import atomic_open
+from .changelog import ID_COL
+from .config import OUTPUT_COLS
+from .record import tag_names
+
+INDEX_VERSION = 2
+FIELD_COLS = OUTPUT_COLS[:6] + [ID_COL]  # everything except Tags and coordinates
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is',
+    'it', 'of', 'on', 'or', 'the', 'to', 'with',
+}
+
+
+def tokenize(text):
+    return [t for t in TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def build_index(sorted_records):
+    tags = sorted({t for rec in sorted_records for t in tag_names(rec.tags)})
+    tag_ids = {t: i for i, t in enumerate(tags)}
+    records = []
+    by_tag = defaultdict(list)
+    tokens = defaultdict(list)
+    for row, rec in enumerate(sorted_records):
+        rec_tags = tag_names(rec.tags)
+        records.append([rec[col] for col in OUTPUT_COLS[:6]] + [rec.uid]
+                       + [[tag_ids[t] for t in rec_tags]])
+        for t in rec_tags:
+            by_tag[t].append(row)
+        for tok in sorted(set(tokenize(rec.name + ' ' + rec.details))):
+            tokens[tok].append(row)
+    return {
+        'version': INDEX_VERSION,
+        'columns': FIELD_COLS,
+        'tags':    tags,
+        'records': records,
+        'by_tag':  by_tag,
+        'tokens':  tokens,
+    }
+
+
+def write_index(index, path):
+    with atomic_open(path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+
+
+def validate_index(index_path, csv_path):
+    """Raise ValueError unless the index and CSV hold the same records."""
+    with open(index_path, encoding='utf-8') as f:
+        index = json.load(f)
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+
+    if rows[0] != OUTPUT_COLS:
+        raise ValueError(f'{csv_path}: unexpected header {rows[0]}')
+    if len(rows) - 1 != len(index['records']):
+        raise ValueError(f'index has {len(index["records"])} records, '
+                         f'CSV has {len(rows) - 1}')
+    if index['columns'] != FIELD_COLS:
+        raise ValueError(f'index has columns {index["columns"]}, expected {FIELD_COLS}')
+    cols = [OUTPUT_COLS.index(col) for col in FIELD_COLS]
+    tags_col = OUTPUT_COLS.index('Tags')
+    tags = index['tags']
+    by_tag = {t: set(rows) for t, rows in index['by_tag'].items()}
+    for i, (row, rec) in enumerate(zip(rows[1:], index['records'])):
+        rec_tags = [tags[t] for t in rec[-1]]
+        if rec[:-1] != [row[c] for c in cols] or '; '.join(rec_tags) != row[tags_col]:
+            raise ValueError(f'record {i} ({row[0]!r}) differs between index and CSV')
+        for t in rec_tags:
+            if i not in by_tag.get(t, ()):
+                raise ValueError(f'record {i} missing from by_tag[{t!r}]')
+    if sum(map(len, index['by_tag'].values())) != sum(len(rec[-1]) for rec in index['records']):
+        raise ValueError('by_tag lists records under tags they do not carry')
@@ -0,0 +1,103 @@
+"""
+Aho-Corasick keyword matcher for KEYWORD_TAGS.
+
+The automaton is compiled once into a deterministic transition table, so
+tagging a text is a single left-to-right pass regardless of how many tags or
+keywords exist.  Matching is plain substring matching on the lowercased
+text, exactly like `kw in text_lower`, so space-padded keywords such as
+' law ' keep their meaning.
+"""
+
+from collections import deque
+
+from .config import KEYWORD_TAGS
+from .record import TAG_BITS
+
+
+class KeywordMatcher:
+    """Multi-pattern matcher mapping keyword hits to tag names."""
+
+    def __init__(self, keyword_tags=KEYWORD_TAGS, tag_bits=None):
+        """tag_bits gives each tag's bit in match_mask(); defaults to 1 << position."""
+        self.tags = [tag for tag, _ in keyword_tags]
+        self.bits = tag_bits or [1 << i for i in range(len(self.tags))]
+        goto = [{}]   # trie edges, later completed into a full DFA
+        out = [0]     # bitmask of tag bits ending at each state
+        for bit, (_, keywords) in zip(self.bits, keyword_tags):
+            for kw in keywords:
+                state = 0
+                for ch in kw:
+                    nxt = goto[state].get(ch)
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto[state][ch] = nxt
+                        goto.append({})
+                        out.append(0)
+                    state = nxt
+                out[state] |= bit
+
+        # Breadth-first: compute failure links and fold them into the edges,
+        # so scanning never has to follow a failure chain at match time.  A
+        # state's failure target is shallower, hence already completed.
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            out[state] |= out[fail[state]]
+            for ch, nxt in goto[state].items():
+                fail[nxt] = goto[fail[state]].get(ch, 0)
+                queue.append(nxt)
+            # Inherit the failure state's edges for characters we lack.
+            for ch, nxt in goto[fail[state]].items():
+                goto[state].setdefault(ch, nxt)
+
+        self._delta = goto
+        self._out = out
+
+    def match_mask(self, text_lower):
+        """Return the OR of the bits of tags whose keywords occur in text_lower."""
+        delta = self._delta
+        out = self._out
+        state = 0
+        mask = 0
+        for ch in text_lower:
+            state = delta[state].get(ch, 0)
+            mask |= out[state]
+        return mask
+
+    def match_all(self, texts):
+        """Return match_mask(text.lower()) for every text, in order.
+
+        The masks are the rows of a text × tag match matrix; scanning the
+        whole batch in one loop avoids a method call per text.
+        """
+        delta = self._delta
+        out = self._out
+        rows = []
+        for text in texts:
+            state = 0
+            mask = 0
+            for ch in text.lower():
+                state = delta[state].get(ch, 0)
+                mask |= out[state]
+            rows.append(mask)
+        return rows
+
+    def match(self, text):
+        """Return matching tags for text, in KEYWORD_TAGS order."""
+        mask = self.match_mask(text.lower())
+        return [tag for tag, bit in zip(self.tags, self.bits) if mask & bit]
+
+
+_default_matcher = None
+
+
+def default_matcher():
+    """Return the shared matcher for KEYWORD_TAGS, compiling it on first use.
+
+    Its masks use the Record tag bits, so they can be OR-ed into rec.tags.
+    """
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = KeywordMatcher(tag_bits=[TAG_BITS[tag] for tag, _ in KEYWORD_TAGS])
+    return _default_matcher
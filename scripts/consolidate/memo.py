@@ -0,0 +1,115 @@
+"""
+Bounded, instrumented memoization for the pure field helpers.
+
+Organisation names and web/email cells repeat across the source sheets,
+so normalize_name() and split_web_email() see the same inputs many times
+per run.  @memoize(maxsize, depends=...) keeps up to maxsize results in
+LRU order and counts hits, misses and evictions.
+
+save_memos()/load_memos() persist every memo between runs.  Each memo is
+stored under a version digest of the patterns it depends on and of its
+function's code, so after a regex or the function changes its stored
+results are ignored.
+"""
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict, namedtuple
+from functools import update_wrapper
+
+from .atomic import atomic_open
+from .config import CACHE_DIR
+
+MEMO_PATH = os.path.join(CACHE_DIR, 'memo.pickle')
+
+MemoInfo = namedtuple('MemoInfo', 'hits misses evictions size maxsize')
+
+MEMOS = {}  # qualified function name → Memo
+
+
+def _hash_code(h, code):
+    """Feed code's bytecode and constants, including nested code objects, to h."""
+    h.update(code.co_code)
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            _hash_code(h, const)
+        else:
+            h.update(repr(const).encode())
+
+
+class Memo:
+    """LRU cache around a one-argument pure function."""
+
+    def __init__(self, fn, maxsize, depends=()):
+        update_wrapper(self, fn)
+        self.fn = fn
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+        h = hashlib.sha256()
+        _hash_code(h, fn.__code__)
+        for pattern in depends:
+            h.update(repr((pattern.pattern, pattern.flags)).encode())
+        self.version = h.hexdigest()
+
+    def __call__(self, arg):
+        cache = self.cache
+        try:
+            result = cache[arg]
+        except KeyError:
+            self.misses += 1
+            result = cache[arg] = self.fn(arg)
+            if len(cache) > self.maxsize:
+                cache.popitem(last=False)
+                self.evictions += 1
+            return result
+        self.hits += 1
+        cache.move_to_end(arg)
+        return result
+
+    def cache_info(self):
+        return MemoInfo(self.hits, self.misses, self.evictions, len(self.cache), self.maxsize)
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+
+    def cache_clear(self):
+        self.cache.clear()
+        self.reset_stats()
+
+
+def memoize(maxsize, depends=()):
+    """Decorator: memoize a one-argument pure function; see Memo."""
+    def decorate(fn):
+        memo = Memo(fn, maxsize, depends)
+        MEMOS[f'{fn.__module__}.{fn.__qualname__}'] = memo
+        return memo
+    return decorate
+
+
+def load_memos(path=MEMO_PATH):
+    """Seed every memo from path; return how many results were loaded."""
+    try:
+        with open(path, 'rb') as f:
+            stored = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return 0
+    loaded = 0
+    for name, memo in MEMOS.items():
+        version, items = stored.get(name, (None, ()))
+        if version != memo.version:
+            continue
+        items = items[-memo.maxsize:]
+        memo.cache.update(items)
+        while len(memo.cache) > memo.maxsize:
+            memo.cache.popitem(last=False)
+        loaded += len(items)
+    return loaded
+
+
+def save_memos(path=MEMO_PATH):
+    stored = {name: (memo.version, list(memo.cache.items())) for name, memo in MEMOS.items()}
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with atomic_open(path, 'wb') as f:
+        pickle.dump(stored, f, protocol=pickle.HIGHEST_PROTOCOL)
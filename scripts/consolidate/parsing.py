@@ -0,0 +1,234 @@
+"""
+Field helpers and per-sheet readers.
+
+Every function here is pure with respect to the pipeline state: readers take
+a data directory (read_standard_file also a sheet name) and are generators
+of Record entries, streaming the sheet row by row.  SOURCES maps each sheet
+the pipeline reads to its reader.
+"""
+
+import csv
+import os
+import re
+from functools import partial
+
+from .classify import (
+    PHONE, URL, EMAIL, ADDRESS, classify_line, split_name_note, split_web_email,
+)
+from .config import DATA_DIR, BASE_SHEET, TAG_FILES, PLACEHOLDER_NAMES, HFF_CRIME_COLS
+from .matcher import default_matcher
+from .memo import memoize
+from .record import Record, tags_mask
+
+WEATHER_SHELTER_TAGS = tags_mask(['Weather-Shelter', 'Housing'])
+HFF_TAGS             = tags_mask(['Housing', 'Housing-Felon-Friendly'])
+JFF_TAGS             = tags_mask(['Employment', 'Jobs-Felon-Friendly'])
+
+
+def iter_csv_raw(fname, data_dir=DATA_DIR):
+    path = os.path.join(data_dir, fname + '.csv')
+    with open(path, 'r', encoding='utf-8-sig', errors='replace') as f:
+        yield from csv.reader(f)
+
+
+def read_csv_raw(fname, data_dir=DATA_DIR):
+    return list(iter_csv_raw(fname, data_dir))
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@memoize(16384, depends=(_WHITESPACE_RE,))
+def normalize_name(name):
+    return _WHITESPACE_RE.sub(' ', name.strip().lower())
+
+
+def auto_tag(text):
+    """Return list of tags suggested by keyword scanning of text."""
+    return default_matcher().match(text)
+
+
+def _standard_data_rows(rows):
+    """Yield the rows after the header (first row with 'Name' in col 0).
+
+    Some files start directly with data; rows are held back only until a
+    header turns up, and all of them are data if none does.
+    """
+    rows = iter(rows)
+    held = []
+    for row in rows:
+        if row and row[0].strip().lower() in ('name/title', 'name', 'name of organization'):
+            yield from rows
+            return
+        held.append(row)
+    yield from held
+
+
+def read_standard_file(fname, data_dir=DATA_DIR):
+    """Read a standard 5-col CSV; yield Records."""
+    for row in _standard_data_rows(iter_csv_raw(fname, data_dir)):
+        if not row or not row[0].strip():
+            continue
+        name = row[0].strip()
+        if normalize_name(name) in PLACEHOLDER_NAMES:
+            continue
+        phone   = row[1].strip() if len(row) > 1 else ''
+        web_raw = row[2].strip() if len(row) > 2 else ''
+        addr    = row[3].strip() if len(row) > 3 else ''
+        details = row[4].strip() if len(row) > 4 else ''
+        url, email = split_web_email(web_raw)
+        yield Record(name, phone, url, email, addr, details)
+
+
+def read_master(data_dir=DATA_DIR):
+    """Read the Master-base.csv snapshot (OUTPUT_COLS minus Tags, header skipped).
+
+    The base is hand-maintained input; Master.csv is only ever written by
+    the pipeline, so reruns never feed on their own output.
+    """
+    rows = iter_csv_raw(BASE_SHEET, data_dir)
+    next(rows, None)  # skip header
+    for row in rows:
+        if not row or not row[0].strip():
+            continue
+        name = row[0].strip()
+        if normalize_name(name) in PLACEHOLDER_NAMES:
+            continue
+
+        phone   = row[1].strip() if len(row) > 1 else ''
+        url     = row[2].strip() if len(row) > 2 else ''
+        email   = row[3].strip() if len(row) > 3 else ''
+        addr    = row[4].strip() if len(row) > 4 else ''
+        details = row[5].strip() if len(row) > 5 else ''
+
+        yield Record(name, phone, url, email, addr, details)
+
+
+def read_weather_shelter(data_dir=DATA_DIR):
+    """Read Weather-Shelter.csv; details fold the extra columns together."""
+    ws_rows = iter_csv_raw('Weather-Shelter', data_dir)
+    # Row 0: description header; Row 1: real column names; Row 2+: data
+    ws_header_note = next(ws_rows, [''])[0]
+    next(ws_rows, None)
+    # Cols: Name, County/Region, Activation Threshold, Phone, Email, Address,
+    #       Hours of Operation, Population Served, Shelter or Motel Vouchers?,
+    #       Reservation Required?, Pets allowed?, Website, Additional Notes
+    for row in ws_rows:
+        if not row or not row[0].strip():
+            continue
+        name = row[0].strip()
+        if normalize_name(name) in PLACEHOLDER_NAMES:
+            continue
+
+        county    = row[1].strip()  if len(row) > 1  else ''
+        threshold = row[2].strip()  if len(row) > 2  else ''
+        phone     = row[3].strip()  if len(row) > 3  else ''
+        email     = row[4].strip()  if len(row) > 4  else ''
+        address   = row[5].strip()  if len(row) > 5  else ''
+        hours     = row[6].strip()  if len(row) > 6  else ''
+        pop       = row[7].strip()  if len(row) > 7  else ''
+        vouchers  = row[8].strip()  if len(row) > 8  else ''
+        reserv    = row[9].strip()  if len(row) > 9  else ''
+        pets      = row[10].strip() if len(row) > 10 else ''
+        website   = row[11].strip() if len(row) > 11 else ''
+        notes     = row[12].strip() if len(row) > 12 else ''
+
+        # Build a rich details string
+        detail_parts = []
+        if county:    detail_parts.append(f'County/Region: {county}')
+        if threshold: detail_parts.append(f'Activation: {threshold}')
+        if hours:     detail_parts.append(f'Hours: {hours}')
+        if pop:       detail_parts.append(f'Serves: {pop}')
+        if vouchers:  detail_parts.append(f'Shelter/Voucher: {vouchers}')
+        if reserv:    detail_parts.append(f'Reservation required: {reserv}')
+        if pets:      detail_parts.append(f'Pets allowed: {pets}')
+        if notes:     detail_parts.append(notes)
+        detail_parts.append(f'[Threshold note: {ws_header_note}]')
+        details = ' | '.join(filter(None, detail_parts))
+
+        url, parsed_email = split_web_email(website)
+        if not parsed_email and email:
+            parsed_email = email
+
+        yield Record(name, phone, url, parsed_email, address, details, WEATHER_SHELTER_TAGS)
+
+
+def read_housing_felon_friendly(data_dir=DATA_DIR):
+    """Parse the multi-line cells of Housing-Felon-Friendly.csv."""
+    hff_rows = iter_csv_raw('Housing-Felon-Friendly', data_dir)
+    # Row 0: title row; Row 1: crime-category headers; Row 2+: data
+    next(hff_rows, None)
+    header = next(hff_rows, None)
+    crime_headers = header[1:16] if header is not None else HFF_CRIME_COLS
+
+    for row in hff_rows:
+        if not row or not row[0].strip():
+            continue
+        cell = row[0].strip()
+        if normalize_name(cell.split('\n')[0]) in PLACEHOLDER_NAMES:
+            continue
+
+        lines = [l.strip() for l in cell.split('\n') if l.strip()]
+        if not lines:
+            continue
+
+        # First line = name (may contain price/notes after dash/comma)
+        name_raw = lines[0]
+        # Strip price notes like "$995", "1b/1a", etc. — keep the actual name
+        name = split_name_note(name_raw)
+
+        # Identify remaining lines as phone, url, email, or address
+        phone = url = email = address = ''
+        remaining_notes = []
+        for line in lines[1:]:
+            kind = classify_line(line, url_seen=bool(url))
+            if kind == PHONE:
+                phone = phone or line
+            elif kind == URL:
+                u, e = split_web_email(line)
+                url   = url   or u
+                email = email or e
+            elif kind == EMAIL:
+                email = email or line
+            elif kind == ADDRESS:
+                address = address or line
+            else:
+                remaining_notes.append(line)
+
+        # Crime policy columns
+        crime_vals = row[1:16]
+        policy_parts = []
+        for i, val in enumerate(crime_vals):
+            val = val.strip()
+            if val and val.upper() not in ('', 'UNK'):
+                col_name = crime_headers[i].strip() if i < len(crime_headers) else f'Col{i}'
+                policy_parts.append(f'{col_name}: {val}')
+
+        details_parts = []
+        if remaining_notes:
+            details_parts.append(' '.join(remaining_notes))
+        if policy_parts:
+            details_parts.append('Policy — ' + ', '.join(policy_parts))
+        details = ' | '.join(details_parts)
+
+        yield Record(name, phone, url, email, address, details, HFF_TAGS)
+
+
+def read_jobs_felon_friendly(data_dir=DATA_DIR):
+    """Read the single-column employer list in Jobs-Felon-Friendly.csv."""
+    for row in iter_csv_raw('Jobs-Felon-Friendly', data_dir):
+        if not row or not row[0].strip():
+            continue
+        name = row[0].strip()
+        yield Record(name, details='Employer known to hire individuals with felony records.',
+                     tags=JFF_TAGS)
+
+
+# ── Source sheet → reader; every reader takes only data_dir ──────────────────
+SOURCES = {fname: partial(read_standard_file, fname) for fname in TAG_FILES}
+SOURCES.update({
+    BASE_SHEET:               read_master,
+    'Weather-Shelter':        read_weather_shelter,
+    'Housing-Felon-Friendly': read_housing_felon_friendly,
+    'Jobs-Felon-Friendly':    read_jobs_felon_friendly,
+})
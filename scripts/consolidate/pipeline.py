@@ -0,0 +1,135 @@
+"""
+Pipeline runner: executes STAGES in order and records wall time, rows
+in/out and peak traced memory for each stage.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass
+
+from .config import DATA_DIR
+from .incremental import (
+    MANIFEST_PATH, file_digest, load_manifest, plan, save_manifest, source_digests,
+)
+from .memo import MEMOS, load_memos, save_memos
+from .record import tag_names
+from .stages import STAGES, Build
+
+
+@dataclass
+class StageStats:
+    name: str
+    seconds: float
+    rows_in: int
+    rows_out: int
+    peak_bytes: int  # 0 when memory tracing is off
+
+
+def run(data_dir=DATA_DIR, out_path=None, trace_memory=True, report=True,
+        incremental=False, manifest_path=MANIFEST_PATH, jobs=1, low_memory=False,
+        memo_path=None):
+    """Run every stage against data_dir; return (build, [StageStats]).
+
+    With incremental=True, sheets whose content hash matches the manifest
+    are not reparsed and only the keys they touch are re-merged; the output
+    is identical to a full rebuild.  jobs > 1 parses sheets in a process
+    pool; merging stays serial and in a fixed order, so output is unchanged.
+    low_memory=True streams every sheet through the merge stages instead of
+    caching parsed sheets; it cannot be combined with incremental or jobs.
+    With memo_path set, the normalize/split memos are loaded from and saved
+    to that file, so cells seen in an earlier run are not parsed again.
+    """
+    if low_memory and (incremental or jobs > 1):
+        raise ValueError('low_memory cannot be combined with incremental or jobs > 1')
+    build = Build(data_dir, out_path, jobs=jobs, stream=low_memory)
+    for memo in MEMOS.values():
+        memo.reset_stats()
+    if memo_path:
+        print(f'Loaded {load_memos(memo_path)} memoized result(s).')
+    if incremental:
+        digests = source_digests(data_dir)
+        manifest = load_manifest(data_dir, manifest_path)
+        if manifest is None:
+            print('No usable manifest; running a full rebuild.')
+        else:
+            changed = plan(build, manifest, digests)
+            print(f'Incremental: {len(changed)} changed source(s) {changed}.')
+    stats = []
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        for name, stage in STAGES:
+            if trace_memory:
+                tracemalloc.reset_peak()
+            t0 = time.perf_counter()
+            rows_in, rows_out = stage(build)
+            seconds = time.perf_counter() - t0
+            peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+            stats.append(StageStats(name, seconds, rows_in, rows_out, peak))
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    if incremental:
+        save_manifest(build, digests, manifest_path)
+    if memo_path:
+        save_memos(memo_path)
+
+    if report:
+        print_summary(build)
+        print_stage_report(stats)
+        print_memo_report()
+    return build, stats
+
+
+def check_idempotent(runs=3, data_dir=DATA_DIR):
+    """Run the pipeline `runs` times; return [(size, sha256)] of each output.
+
+    The runs read and write a scratch copy of data_dir, so the published
+    Master.csv, its artifacts and the reports are left alone.  Inputs and
+    output are separate files, so every entry should be equal.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        work = os.path.join(tmp, 'data')
+        shutil.copytree(data_dir, work, ignore=shutil.ignore_patterns('reports'))
+        for _ in range(runs):
+            build, _ = run(work, trace_memory=False, report=False)
+            results.append((os.path.getsize(build.out_path), file_digest(build.out_path)))
+    return results
+
+
+def print_summary(build):
+    total = len(build.sorted_records)
+    print(f'\nDone! {total} records written to data/Master.csv')
+
+    tag_counts = Counter()
+    for rec in build.sorted_records:
+        for t in tag_names(rec.tags):
+            tag_counts[t] += 1
+
+    print('\nEntries per tag:')
+    for tag, count in sorted(tag_counts.items(), key=lambda x: -x[1]):
+        print(f'  {tag:<30} {count}')
+
+
+def print_stage_report(stats):
+    print('\nStage timings:')
+    print(f'  {"stage":<24} {"seconds":>9} {"rows in":>8} {"rows out":>9} {"peak KiB":>9}')
+    for s in stats:
+        print(f'  {s.name:<24} {s.seconds:>9.4f} {s.rows_in:>8} {s.rows_out:>9} '
+              f'{s.peak_bytes / 1024:>9.0f}')
+    print(f'  {"total":<24} {sum(s.seconds for s in stats):>9.4f}')
+
+
+def print_memo_report():
+    """Hit/miss counts of this process's memos (pool workers keep their own)."""
+    print('\nMemo caches:')
+    for name, memo in MEMOS.items():
+        info = memo.cache_info()
+        print(f'  {name.rsplit(".", 1)[-1]:<24} {info.hits:>7} hits {info.misses:>7} misses '
+              f'{info.evictions:>5} evicted  {info.size}/{info.maxsize} cached')
@@ -0,0 +1,76 @@
+"""
+Compact record representation.
+
+A Record holds the six text fields in __slots__ and its tags as an int
+bitmask over KNOWN_TAGS, instead of a dict plus a per-record set.  Generic
+code can still address fields by output column name (rec['Phone']).  lat
+and lon stay None until the geocode stage resolves the address, and uid
+stays '' until the record ids stage assigns its stable id.
+"""
+
+from functools import lru_cache
+
+from .config import KNOWN_TAGS, OUTPUT_COLS
+
+TAG_BITS = {tag: 1 << i for i, tag in enumerate(KNOWN_TAGS)}
+UNCATEGORIZED = TAG_BITS['Uncategorized']
+
+
+def tags_mask(names):
+    """Bitmask for an iterable of tag names."""
+    mask = 0
+    for name in names:
+        mask |= TAG_BITS[name]
+    return mask
+
+
+@lru_cache(maxsize=None)
+def tag_names(mask):
+    """Alphabetically sorted tag names set in mask."""
+    return tuple(sorted(tag for tag, bit in TAG_BITS.items() if mask & bit))
+
+
+class Record:
+    __slots__ = ('name', 'phone', 'url', 'email', 'address', 'details', 'tags', 'lat', 'lon',
+                 'uid')
+
+    COLUMN_ATTRS = dict(zip(OUTPUT_COLS[:6], __slots__[:6]))
+
+    def __init__(self, name, phone='', url='', email='', address='', details='', tags=0,
+                 lat=None, lon=None, uid=''):
+        self.name = name
+        self.phone = phone
+        self.url = url
+        self.email = email
+        self.address = address
+        self.details = details
+        self.tags = tags
+        self.lat = lat
+        self.lon = lon
+        self.uid = uid
+
+    def __getitem__(self, col):
+        return getattr(self, self.COLUMN_ATTRS[col])
+
+    def __setitem__(self, col, value):
+        setattr(self, self.COLUMN_ATTRS[col], value)
+
+    def __getstate__(self):
+        return tuple(getattr(self, attr) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        for attr, value in zip(self.__slots__, state):
+            setattr(self, attr, value)
+
+    def __repr__(self):
+        return f'Record({self.name!r}, tags={list(tag_names(self.tags))})'
+
+    def copy(self):
+        return Record(self.name, self.phone, self.url, self.email,
+                      self.address, self.details, self.tags, self.lat, self.lon, self.uid)
+
+    def row(self):
+        """The record as a Master.csv row."""
+        coords = ['', ''] if self.lat is None else [f'{self.lat:.4f}', f'{self.lon:.4f}']
+        return [self.name, self.phone, self.url, self.email,
+                self.address, self.details, '; '.join(tag_names(self.tags))] + coords + [self.uid]
@@ -0,0 +1,178 @@
+"""
+Offline BM25 retrieval over the published records.
+
+The chat route used to paste every record into its prompt.  This index
+lets it send only the records relevant to a question: the pipeline builds
+Master.search.json next to Master.csv, and search() returns the Record IDs
+of the best matches in a few milliseconds.  Internally the index ranks rows
+(positions in Master.csv, as in Master.index.json), but rows shift between
+builds, so "ids" maps each row to its stable Record ID and only ids are
+returned.
+
+Each record is one document made of its name (counted NAME_BOOST times),
+its tags and its details.  BM25 term weights do not depend on the query,
+so they are computed at build time and stored with the postings; a query
+only sums the postings of its terms and keeps the top k.
+
+Documents are indexed with their acronyms spelled out next to them, and
+"synonyms" maps each acronym term to the terms of its spelled-out form, so
+a query for "aps" also scores records that only write "Adult Protective
+Services".  Layout:
+
+    {
+      "version":  3,
+      "records":  1611,
+      "ids":      ["2ae6724c4d9f", ...],    # row → Record ID
+      "tags":     ["Benefits", ...],
+      "by_tag":   {"Food": [rows], ...},
+      "postings": {"pantry": [[rows], [weights]], ...},
+      "synonyms": {"aps": ["adult", "protective", "service"], ...}
+    }
+"""
+
+import heapq
+import json
+import os
+from collections import Counter, defaultdict
+from functools import lru_cache
+from math import log
+
+from .atomic import atomic_open
+from .config import DATA_DIR
+from .index import tokenize
+
+SEARCH_VERSION = 3
+SEARCH_PATH = os.path.join(DATA_DIR, 'Master.search.json')
+
+K1 = 1.2
+B = 0.75
+NAME_BOOST = 2
+
+
+def stem(token):
+    """Fold simple plurals ("shelters" → "shelter") so queries match either form."""
+    if len(token) > 3 and token.endswith('s') and not token.endswith(('ss', 'us', 'is')):
+        return token[:-1]
+    return token
+
+
+def terms(text):
+    return [stem(t) for t in tokenize(text)]
+
+
+def _idf(n, df):
+    # The "+ 1" keeps the weight positive for terms in over half the records
+    return log(1 + (n - df + 0.5) / (df + 0.5))
+
+
+def build_search_index(docs, synonyms=None):
+    """Build the index from (record id, name, tags, details) per record, in row order.
+
+    synonyms maps lowercase acronyms to their spelled-out forms.
+    """
+    doc_terms = []
+    record_ids = []
+    by_tag = defaultdict(list)
+    for row, (record_id, name, tags, details) in enumerate(docs):
+        record_ids.append(record_id)
+        doc_terms.append(Counter(terms(name) * NAME_BOOST + terms(' '.join(tags))
+                                 + terms(details)))
+        for t in tags:
+            by_tag[t].append(row)
+
+    n = len(doc_terms)
+    avgdl = sum(sum(c.values()) for c in doc_terms) / n if n else 0.0
+    df = Counter(term for c in doc_terms for term in c)
+    postings = defaultdict(lambda: ([], []))
+    for row, counts in enumerate(doc_terms):
+        norm = K1 * (1 - B + B * sum(counts.values()) / avgdl)
+        for term, tf in counts.items():
+            idf = _idf(n, df[term])
+            rows, weights = postings[term]
+            rows.append(row)
+            weights.append(round(idf * tf * (K1 + 1) / (tf + norm), 4))
+    synonym_terms = {}
+    for acronym, spelled in (synonyms or {}).items():
+        key = terms(acronym)
+        if len(key) == 1:
+            synonym_terms[key[0]] = terms(spelled)
+    return {
+        'version':  SEARCH_VERSION,
+        'records':  n,
+        'ids':      record_ids,
+        'tags':     sorted(by_tag),
+        'by_tag':   by_tag,
+        'postings': postings,
+        'synonyms': synonym_terms,
+    }
+
+
+def write_search_index(index, path):
+    with atomic_open(path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+
+
+class SearchIndex:
+    """A loaded search index; see search() for the query semantics."""
+
+    def __init__(self, index):
+        if index.get('version') != SEARCH_VERSION:
+            raise ValueError(f'unsupported search index version {index.get("version")}')
+        self.records = index['records']
+        self.ids = index['ids']
+        self.by_tag = {t: frozenset(rows) for t, rows in index['by_tag'].items()}
+        self.postings = index['postings']
+        self.synonyms = index['synonyms']
+
+    @classmethod
+    def load(cls, path=SEARCH_PATH):
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def search(self, query, tags=None, k=20):
+        """Return the Record IDs of up to k records, best match first; see rank()."""
+        return self.record_ids(self.rank(query, tags, k))
+
+    def rank(self, query, tags=None, k=20):
+        """Return up to k rows of this build, best match first.
+
+        tags restricts results to records carrying at least one of the
+        given tags.  Ties keep row order; a query with no searchable terms
+        returns the first k (matching) records.  Acronym terms also match
+        the terms of their spelled-out form.
+        """
+        allowed = None
+        if tags:
+            allowed = frozenset().union(*(self.by_tag.get(t, ()) for t in tags))
+        scores = defaultdict(float)
+        query_terms = set(terms(query))
+        for term in list(query_terms):
+            query_terms.update(self.synonyms.get(term, ()))
+        for term in query_terms:
+            rows, weights = self.postings.get(term, ((), ()))
+            for row, w in zip(rows, weights):
+                scores[row] += w
+        if not query_terms:
+            pool = sorted(allowed) if allowed is not None else range(self.records)
+            return list(pool[:k])
+        if allowed is not None:
+            scores = {row: s for row, s in scores.items() if row in allowed}
+        return [row for row, _ in heapq.nsmallest(k, scores.items(),
+                                                  key=lambda item: (-item[1], item[0]))]
+
+    def record_ids(self, rows):
+        """Record IDs of rows returned by rank()."""
+        return [self.ids[row] for row in rows]
+
+
+@lru_cache(maxsize=None)
+def _default_index(path):
+    return SearchIndex.load(path)
+
+
+def search(query, tags=None, k=20, path=SEARCH_PATH):
+    """Record IDs of the best matches in the published index at path.
+
+    See SearchIndex.rank() for the query semantics.
+    """
+    return _default_index(path).search(query, tags, k)
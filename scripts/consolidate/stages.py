@@ -0,0 +1,471 @@
+"""
+Pipeline stages.
+
+Each stage takes the shared Build state, mutates it, and returns a
+(rows_in, rows_out) pair for the stage report: rows_in is what the stage
+consumed (source rows or existing records), rows_out is what it left behind.
+"""
+
+import csv
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from .acronyms import AcronymTable, load_acronyms
+from .atomic import atomic_open
+from .changelog import diff_builds, read_build, record_id, write_changelog
+from .config import BASE_SHEET, DATA_DIR, OUTPUT_COLS, TAG_FILES, URL_RE
+from .database import validate_database, write_database
+from .dedupe import find_duplicates, merge_into
+from .geo import geocode
+from .incremental import file_digest
+from .index import build_index, validate_index, write_index
+from .matcher import default_matcher
+from .parsing import SOURCES, normalize_name
+from .record import TAG_BITS, UNCATEGORIZED, tag_names
+from .search import build_search_index, write_search_index
+from .tagaudit import audit_tags, write_audit
+from .validate import validate_records, write_report
+
+
+class Build:
+    """Mutable state threaded through the stages of one pipeline run.
+
+    parsed caches each source sheet's reader output so a sheet read by two
+    stages is parsed once (and can be pre-seeded from a manifest); the parse
+    stage fills it, across `jobs` worker processes when jobs > 1.  With
+    stream=True nothing is cached: stages pull entries straight from the
+    readers, so peak memory tracks the merged records, not the raw sheets.
+    When scope is a set of normalized names, stages only see entries with
+    those keys; carried holds finished records for every other key.
+    """
+
+    def __init__(self, data_dir=DATA_DIR, out_path=None, scope=None, jobs=1, stream=False):
+        self.data_dir = data_dir
+        self.out_path = out_path or os.path.join(data_dir, 'Master.csv')
+        self.index_path = os.path.splitext(self.out_path)[0] + '.index.json'
+        self.search_path = os.path.splitext(self.out_path)[0] + '.search.json'
+        self.sqlite_path = os.path.splitext(self.out_path)[0] + '.sqlite'
+        self.changes_path = os.path.splitext(self.out_path)[0] + '.changes.json'
+        self.report_dir = os.path.join(data_dir, 'reports')
+        self.scope = scope
+        self.jobs = jobs
+        self.stream = stream
+        self.parsed = {}   # source name → list of entries, as read
+        self.carried = {}  # key → finished record from a previous run
+        self.name_to_tags = defaultdict(int)  # key → tag bitmask
+        self.records = {}  # key = normalized name → Record
+        self.keyed = {}    # records before cross-key dedupe
+        self.sorted_records = []
+        self.merged = {}   # key folded in by dedupe → survivor key
+        self.previous = None  # (sha256, header, {id: row}) of the Master.csv replaced
+        self.acronyms = AcronymTable({})
+
+    def entries(self, fname):
+        """Yield (key, entry) for fname within scope; entries are never shared."""
+        if fname in self.parsed:
+            source = (e.copy() for e in self.parsed[fname])
+        elif self.stream:
+            source = SOURCES[fname](self.data_dir)
+        else:
+            self.parsed[fname] = parse_source(fname, self.data_dir)
+            source = (e.copy() for e in self.parsed[fname])
+        for e in source:
+            key = normalize_name(e.name)
+            if self.scope is None or key in self.scope:
+                yield key, e
+
+
+def fill_missing(rec, entry, fields=('Phone', 'Web/Link', 'Email', 'Physical Address')):
+    """Copy each of fields from entry into rec where rec has it empty."""
+    for field in fields:
+        if not rec[field] and entry[field]:
+            rec[field] = entry[field]
+
+
+def parse_source(fname, data_dir):
+    return list(SOURCES[fname](data_dir))
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 0 – Parse every source sheet not already cached
+# ══════════════════════════════════════════════════════════════════════════════
+def parse_sources(build):
+    if build.stream:
+        print('Streaming source sheets (no parse cache)...')
+        return 0, 0
+    pending = [fname for fname in SOURCES if fname not in build.parsed]
+    print(f'Parsing {len(pending)} source sheet(s)...')
+    if build.jobs > 1 and len(pending) > 1:
+        # Sheets are independent; map() keeps results in SOURCES order.
+        with ProcessPoolExecutor(max_workers=min(build.jobs, len(pending))) as pool:
+            parsed = pool.map(parse_source, pending, [build.data_dir] * len(pending))
+            build.parsed.update(zip(pending, parsed))
+    else:
+        for fname in pending:
+            build.parsed[fname] = parse_source(fname, build.data_dir)
+
+    if build.scope is not None:
+        # Incremental run: keys the changed sheets now contain join the scope.
+        for fname in pending:
+            build.scope.update(normalize_name(e.name) for e in build.parsed[fname])
+        build.carried = {k: rec for k, rec in build.carried.items() if k not in build.scope}
+        print(f'  {len(build.scope)} key(s) to re-merge.')
+    rows = sum(len(build.parsed[fname]) for fname in pending)
+    return rows, rows
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 1 – Build name → tags map from all tag files
+# ══════════════════════════════════════════════════════════════════════════════
+def build_tag_map(build):
+    print('Building tag map from sub-files...')
+    rows_in = 0
+    for fname in TAG_FILES:
+        bit = TAG_BITS[fname]  # filename = tag name
+        for key, e in build.entries(fname):
+            rows_in += 1
+            build.name_to_tags[key] |= bit
+    return rows_in, len(build.name_to_tags)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 2 – Load the Master-base.csv snapshot
+# ══════════════════════════════════════════════════════════════════════════════
+def load_master(build):
+    print('Loading Master-base.csv...')
+    records = build.records
+    rows_in = 0
+    for key, e in build.entries(BASE_SHEET):
+        rows_in += 1
+        e.tags = build.name_to_tags.get(key, 0)
+        if key in records:
+            # Duplicate in Master – merge tags, keep most-complete fields
+            existing = records[key]
+            existing.tags |= e.tags
+            fill_missing(existing, e, fields=OUTPUT_COLS[1:6])
+        else:
+            records[key] = e
+    return rows_in, len(records)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 3 – Add missing entries from Rural & SO sub-files
+# ══════════════════════════════════════════════════════════════════════════════
+def merge_rural_so(build):
+    print('Adding missing entries from Rural and SO...')
+    records = build.records
+    rows_in = 0
+    for fname in ('Rural', 'SO'):
+        bit = TAG_BITS[fname]
+        for key, e in build.entries(fname):
+            rows_in += 1
+            if key not in records:
+                e.tags = bit
+                records[key] = e
+            else:
+                records[key].tags |= bit
+    return rows_in, len(records)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 4 – Add Weather-Shelter entries
+# ══════════════════════════════════════════════════════════════════════════════
+def merge_weather_shelter(build):
+    print('Adding Weather-Shelter entries...')
+    records = build.records
+    rows_in = 0
+    for key, e in build.entries('Weather-Shelter'):
+        rows_in += 1
+        if key not in records:
+            records[key] = e
+        else:
+            rec = records[key]
+            rec.tags |= e.tags
+            fill_missing(rec, e)
+            # Prepend weather-shelter details if not already there
+            if e.details and e.details not in rec.details:
+                rec.details = (e.details + ' | ' + rec.details).strip(' | ')
+    return rows_in, len(records)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 5 – Parse & add Housing-Felon-Friendly entries
+# ══════════════════════════════════════════════════════════════════════════════
+def merge_housing_felon_friendly(build):
+    print('Parsing Housing-Felon-Friendly entries...')
+    records = build.records
+    rows_in = 0
+    for key, e in build.entries('Housing-Felon-Friendly'):
+        rows_in += 1
+        if key not in records:
+            records[key] = e
+        else:
+            rec = records[key]
+            rec.tags |= e.tags
+            fill_missing(rec, e)
+            # Append housing policy details if not already there
+            if e.details and e.details not in rec.details:
+                rec.details = (rec.details + ' | ' + e.details).strip(' | ')
+    return rows_in, len(records)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 6 – Add Jobs-Felon-Friendly employer names
+# ══════════════════════════════════════════════════════════════════════════════
+def merge_jobs_felon_friendly(build):
+    print('Adding Jobs-Felon-Friendly employer names...')
+    records = build.records
+    rows_in = 0
+    for key, e in build.entries('Jobs-Felon-Friendly'):
+        rows_in += 1
+        if key not in records:
+            records[key] = e
+        else:
+            records[key].tags |= e.tags
+    return rows_in, len(records)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 7 – Load the acronym expansion table (Acronyms.csv)
+# ══════════════════════════════════════════════════════════════════════════════
+def load_acronym_table(build):
+    print('Loading acronym table...')
+    build.acronyms = load_acronyms(build.data_dir)
+    print(f'  {len(build.acronyms)} acronyms.')
+    return len(build.acronyms), len(build.acronyms)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 8 – Auto-tag entries with no tags (or sparse tags)
+# ══════════════════════════════════════════════════════════════════════════════
+def auto_tag_records(build):
+    print('Auto-tagging untagged entries...')
+    untagged = [rec for rec in build.records.values() if not rec.tags]
+    expand = build.acronyms.expand
+    guesses = default_matcher().match_all(expand(' '.join([rec.name, rec.details]), keep=True)
+                                          for rec in untagged)
+    auto_tagged = 0
+    for rec, guessed in zip(untagged, guesses):
+        if guessed:
+            rec.tags |= guessed
+            auto_tagged += 1
+        else:
+            rec.tags = UNCATEGORIZED
+    print(f'  Auto-tagged {auto_tagged} entries.')
+    return len(build.records), len(build.records)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 9 – Remove junk entries (URLs as names, very short nonsensical names)
+# ══════════════════════════════════════════════════════════════════════════════
+def remove_junk(build):
+    print('Removing junk entries...')
+    records = build.records
+    rows_in = len(records)
+    junk_keys = set()
+    for key, rec in records.items():
+        name = rec.name
+        if URL_RE.match(name):           # name is a bare URL
+            junk_keys.add(key)
+        elif len(name.strip()) < 3:      # name is just 1-2 chars
+            junk_keys.add(key)
+    for k in junk_keys:
+        del records[k]
+    print(f'  Removed {len(junk_keys)} junk entries.')
+    # Per-key processing ends here; records outside the scope of an
+    # incremental run come from the manifest.
+    records.update(build.carried)
+    return rows_in, len(records)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 10 – Merge fuzzy duplicates across normalized-name keys
+# ══════════════════════════════════════════════════════════════════════════════
+def dedupe_records(build):
+    print('Merging fuzzy duplicates...')
+    # The per-key records are what an incremental run carries over, so this
+    # and every later stage work on copies and leave build.keyed untouched.
+    build.keyed = build.records
+    records = {key: rec.copy() for key, rec in build.keyed.items()}
+    review = []
+    merged = build.merged = {}
+    for survivor_key, dups in find_duplicates(records, build.acronyms):
+        survivor = records[survivor_key]
+        for key, rule in dups:
+            dup = records.pop(key)
+            row = [survivor.name, dup.name, rule,
+                   survivor.phone, dup.phone, survivor.url, dup.url]
+            dropped = merge_into(survivor, dup)
+            review.append(row + [' | '.join(f'{field}: {value}' for field, value in dropped)])
+            merged[key] = survivor_key
+        records[survivor_key] = survivor
+    build.records = records
+
+    os.makedirs(build.report_dir, exist_ok=True)
+    with atomic_open(os.path.join(build.report_dir, 'dedupe-review.csv'), 'w',
+                     newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Kept', 'Merged', 'Rule', 'Kept Phone', 'Merged Phone',
+                         'Kept Web/Link', 'Merged Web/Link', 'Dropped'])
+        writer.writerows(review)
+    print(f'  Merged {len(review)} duplicate entries (see reports/dedupe-review.csv).')
+    return len(build.keyed), len(records)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 11 – Resolve addresses to Colorado place centroids
+# ══════════════════════════════════════════════════════════════════════════════
+def geocode_records(build):
+    print('Geocoding addresses...')
+    located = 0
+    places = set()
+    for rec in build.records.values():
+        hit = geocode(rec.address) if rec.address else None
+        rec.lat, rec.lon = hit[1:] if hit else (None, None)
+        if hit:
+            located += 1
+            places.add(hit[0])
+    print(f'  Located {located} of {len(build.records)} records in {len(places)} places.')
+    return len(build.records), located
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 12 – Assign stable record ids and read the build being replaced
+# ══════════════════════════════════════════════════════════════════════════════
+def assign_record_ids(build):
+    print('Assigning record ids...')
+    for key, rec in build.records.items():
+        rec.uid = record_id(key)
+    if len({rec.uid for rec in build.records.values()}) != len(build.records):
+        raise ValueError('record id collision; increase changelog.ID_LEN')
+    build.previous = read_build(build.out_path)
+    previous = len(build.previous[2]) if build.previous else 0
+    print(f'  {len(build.records)} ids; previous build has {previous} records.')
+    return len(build.records), len(build.records)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 13 – Normalize phones, URLs and emails and report invalid values
+# ══════════════════════════════════════════════════════════════════════════════
+def validate_fields(build):
+    print('Validating phones, URLs and emails...')
+    report = validate_records(list(build.records.values()))
+    os.makedirs(build.report_dir, exist_ok=True)
+    write_report(report, os.path.join(build.report_dir, 'quality.json'))
+    normalized = sum(n for rule, n in report['counts'].items() if rule.endswith('.normalized'))
+    print(f'  Normalized {normalized} fields; {len(report["issues"])} invalid values '
+          f'(see reports/quality.json).')
+    return len(build.records), len(build.records)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 14 – Write output Master.csv
+# ══════════════════════════════════════════════════════════════════════════════
+def sort_key(rec):
+    """Sort: tagged entries first (alphabetically), then uncategorized."""
+    is_uncategorized = rec.tags == UNCATEGORIZED
+    return (int(is_uncategorized), rec.name.lower())
+
+
+def write_master(build):
+    print('Writing consolidated Master.csv...')
+    # The sort holds only references to the records; rows are formatted one
+    # at a time as the writer consumes them.
+    build.sorted_records = sorted(build.records.values(), key=sort_key)
+
+    with atomic_open(build.out_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(OUTPUT_COLS)
+        writer.writerows(rec.row() for rec in build.sorted_records)
+    return len(build.records), len(build.sorted_records)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 15 – Write Master.changes.json against the build that was replaced
+# ══════════════════════════════════════════════════════════════════════════════
+def write_changes(build):
+    print('Writing Master.changes.json...')
+    base, header, old_rows = build.previous or (None, [], {})
+    new_rows = {rec.uid: rec.row() for rec in build.sorted_records}
+    merged = {record_id(key): record_id(survivor) for key, survivor in build.merged.items()}
+    diff = diff_builds(header, old_rows, new_rows, merged)
+    changelog = write_changelog(diff, base, file_digest(build.out_path), build.changes_path)
+    print('  ' + ', '.join(f'{n} {kind}' for kind, n in changelog['counts'].items()) + '.')
+    return len(old_rows) + len(new_rows), sum(changelog['counts'].values())
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 16 – Write the prebuilt JSON index and check it round-trips
+# ══════════════════════════════════════════════════════════════════════════════
+def write_master_index(build):
+    print('Writing Master.index.json...')
+    index = build_index(build.sorted_records)
+    write_index(index, build.index_path)
+    validate_index(build.index_path, build.out_path)
+    print(f'  {len(index["records"])} records, {len(index["tags"])} tags, '
+          f'{len(index["tokens"])} tokens; round-trip OK.')
+    return len(build.sorted_records), len(index['records'])
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 17 – Export Master.sqlite (resources, tags, FTS) and check it against the CSV
+# ══════════════════════════════════════════════════════════════════════════════
+def write_sqlite(build):
+    print('Writing Master.sqlite...')
+    write_database(build.sorted_records, build.sqlite_path, build.acronyms.synonyms())
+    validate_database(build.sqlite_path, build.out_path)
+    print(f'  {len(build.sorted_records)} resources; row counts match the CSV.')
+    return len(build.sorted_records), len(build.sorted_records)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 18 – Write the BM25 search index used to pick records for the chat prompt
+# ══════════════════════════════════════════════════════════════════════════════
+def write_search(build):
+    print('Writing Master.search.json...')
+    expand = build.acronyms.expand
+    index = build_search_index(((rec.uid, expand(rec.name, keep=True), tag_names(rec.tags),
+                                 expand(rec.details, keep=True))
+                                for rec in build.sorted_records),
+                               build.acronyms.synonyms())
+    write_search_index(index, build.search_path)
+    print(f'  {index["records"]} records, {len(index["postings"])} terms.')
+    return len(build.sorted_records), index['records']
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STEP 19 – Audit tags of every record against the keyword categories
+# ══════════════════════════════════════════════════════════════════════════════
+def audit_record_tags(build):
+    print('Auditing tags...')
+    audit = audit_tags(build.sorted_records, build.acronyms)
+    os.makedirs(build.report_dir, exist_ok=True)
+    write_audit(audit, os.path.join(build.report_dir, 'tag-audit.json'))
+    print(f'  {len(audit["suggested"])} records with suggested tags, '
+          f'{len(audit["conflicting"])} with conflicting tags (see reports/tag-audit.json).')
+    return len(build.sorted_records), audit['records']
+
+
+STAGES = [
+    ('parse',                  parse_sources),
+    ('tag map',                build_tag_map),
+    ('master load',            load_master),
+    ('rural/so merge',         merge_rural_so),
+    ('weather-shelter',        merge_weather_shelter),
+    ('housing-felon-friendly', merge_housing_felon_friendly),
+    ('jobs-felon-friendly',    merge_jobs_felon_friendly),
+    ('acronyms',               load_acronym_table),
+    ('auto-tag',               auto_tag_records),
+    ('junk removal',           remove_junk),
+    ('dedupe',                 dedupe_records),
+    ('geocode',                geocode_records),
+    ('record ids',             assign_record_ids),
+    ('validate',               validate_fields),
+    ('write',                  write_master),
+    ('changelog',              write_changes),
+    ('index',                  write_master_index),
+    ('sqlite',                 write_sqlite),
+    ('search',                 write_search),
+    ('tag audit',              audit_record_tags),
+]
@@ -0,0 +1,78 @@
+"""
+Tag-quality audit over every published record.
+
+The auto-tag stage only looks at records no sheet tagged.  This audit
+scores all records against every KEYWORD_TAGS category at once and
+compares the result with the tags they carry:
+
+  - suggested: categories whose keywords a record matches but that it
+    does not carry;
+  - conflicting: categories a record carries although its text matches
+    none of their keywords while it does match other categories;
+  - coverage: per category, how many records carry it, how many match
+    its keywords, and how many do both.
+
+The record × category match matrix is one bitmask per record (bit =
+TAG_BITS[tag]) from a single matcher pass over the batch.  Coverage is
+counted over the distinct (carried, matched) row pairs, which are far
+fewer than the records.  Text is matched with acronyms spelled out, as in
+the auto-tag stage.
+"""
+
+import json
+from collections import Counter
+
+from .atomic import atomic_open
+from .config import KEYWORD_TAGS
+from .matcher import default_matcher
+from .record import TAG_BITS, tag_names, tags_mask
+
+KEYWORD_MASK = tags_mask(tag for tag, _ in KEYWORD_TAGS)
+
+
+def keyword_matrix(records, acronyms=None):
+    """Return the keyword-match bitmask of each record, in order."""
+    texts = (' '.join([rec.name, rec.details]) for rec in records)
+    if acronyms:
+        texts = (acronyms.expand(text, keep=True) for text in texts)
+    return default_matcher().match_all(texts)
+
+
+def audit_tags(records, acronyms=None):
+    """Audit records (in published row order); ids in the result are row positions."""
+    matched = keyword_matrix(records, acronyms)
+    carried = [rec.tags & KEYWORD_MASK for rec in records]
+
+    pairs = Counter(zip(carried, matched))
+    coverage = {}
+    for tag, _ in KEYWORD_TAGS:
+        bit = TAG_BITS[tag]
+        coverage[tag] = {
+            'carried': sum(n for (have, found), n in pairs.items() if have & bit),
+            'matched': sum(n for (have, found), n in pairs.items() if found & bit),
+            'both':    sum(n for (have, found), n in pairs.items() if have & found & bit),
+        }
+
+    suggested = []
+    conflicting = []
+    for rid, (have, found) in enumerate(zip(carried, matched)):
+        if have == found:
+            continue
+        name = records[rid].name
+        if found & ~have:
+            suggested.append({'id': rid, 'name': name, 'tags': tag_names(found & ~have)})
+        if have & ~found and found:
+            conflicting.append({'id': rid, 'name': name, 'carried': tag_names(have & ~found),
+                                'matched': tag_names(found)})
+    return {
+        'records':     len(records),
+        'coverage':    coverage,
+        'suggested':   suggested,
+        'conflicting': conflicting,
+    }
+
+
+def write_audit(audit, path):
+    with atomic_open(path, 'w', encoding='utf-8') as f:
+        json.dump(audit, f, ensure_ascii=False, indent=1)
+        f.write('\n')
@@ -0,0 +1,217 @@
+"""
+Field validation and normalization of Phone, Web/Link and Email.
+
+One pass over the records rewrites each field into its canonical form and
+counts every rule that fired:
+
+  - Phone: each number becomes E.164 ("+17194656542", "ext. 12" kept),
+    prefixed by the label written before it ("office: +13039851776").
+    A cell is left as written when it holds no valid North American
+    number or text other than labels between its numbers (vanity numbers,
+    notes, addresses).
+  - Web/Link: lowercase scheme and host, "https://" added to bare hosts,
+    trailing punctuation, default ports and repeats dropped ("a.org" and
+    "a.org/" are the same URL).
+  - Email: lowercased; a cell with anything that is not an address is left
+    as written.
+
+Placeholders ("not found", "n/a") are cleared in all three.
+
+Rules ending in ".normalized" or ".placeholder" describe rewrites; the
+others flag values left for a maintainer.  validate_records() returns the
+report written to reports/quality.json:
+
+    {
+      "records": 1611,
+      "rules":   {rule: description, ...},
+      "counts":  {rule: records, ...},
+      "issues":  [{"id": record id, "name": ..., "rule": ..., "value": ...}, ...]
+    }
+
+Rewriting is idempotent, so records carried over by an incremental run
+come out the same.
+"""
+
+import json
+import re
+from collections import Counter
+from urllib.parse import urlsplit, urlunsplit
+
+from .atomic import atomic_open
+from .classify import split_web_email
+from .config import EMAIL_RE, PHONE_RE
+
+RULES = {
+    'phone.normalized':   'rewritten as labelled E.164 numbers',
+    'phone.placeholder':  'placeholder text cleared',
+    'phone.invalid':      'no valid North American number',
+    'phone.extra-text':   'text other than labels around the numbers',
+    'phone.misplaced':    'an email or URL in the Phone column',
+    'url.normalized':     'scheme, host or trailing punctuation canonicalized',
+    'url.placeholder':    'placeholder text cleared',
+    'url.invalid':        'not a URL',
+    'url.misplaced':      'an email in the Web/Link column',
+    'email.normalized':   'lowercased',
+    'email.placeholder':  'placeholder text cleared',
+    'email.invalid':      'not an email address',
+}
+
+PLACEHOLDERS = {'not found', 'no ph num', 'n/a', 'na', 'none', '-'}
+
+# PHONE_RE plus an optional country code and extension, not inside a longer
+# digit run; group 1 is the ten-digit number, group 2 the extension.
+NUMBER_RE = re.compile(r'(?<![\d+])(?:\+?1[\s.\-]?)?' + PHONE_RE.pattern
+                       + r'(?:\s*(?:ext\.?|x)\s*(\d{1,5}))?(?!\d)', re.IGNORECASE)
+NANP_RE = re.compile(r'[2-9]\d{2}[2-9]\d{6}')
+NON_DIGIT_RE = re.compile(r'\D')
+LABEL_RE = re.compile(r"(?=.*[A-Za-z])(?!.*\d{3})[\w /&'.+-]{1,30}")
+LABEL_JOINERS = {'or', 'and'}
+LABEL_STRIP = ' \t\n:;,|-'
+BARE_HOST_RE = re.compile(r'[a-z0-9-]+(?:\.[a-z0-9-]+)*\.[a-z]{2,}(?:/\S*)?', re.IGNORECASE)
+EMAIL_SPLIT_RE = re.compile(r'[;,\s]+')
+DEFAULT_PORTS = {'http': ':80', 'https': ':443'}
+# split_web_email() only knows lowercase "http"/"www." prefixes
+SCHEME_RE = re.compile(r'(?<![\w.])(?:https?://|www\.)', re.IGNORECASE)
+DASHES = str.maketrans('\u2010\u2011\u2012\u2013\u2014', '-----')
+
+
+def _label(text):
+    """The label in text between numbers, '' for none, or None if it is not one."""
+    text = text.strip(LABEL_STRIP)
+    if text.startswith('(') and text.endswith(')'):
+        text = text[1:-1].strip(LABEL_STRIP)
+    if not text or text.lower() in LABEL_JOINERS:
+        return ''
+    return text if LABEL_RE.fullmatch(text) else None
+
+
+def normalize_phone(cell):
+    """Return (value, rule or None) for a Phone cell."""
+    cell_dashes = cell.translate(DASHES)
+    matches = list(NUMBER_RE.finditer(cell_dashes))
+    if not matches:
+        if '@' in cell or 'http' in cell or 'www.' in cell:
+            return cell, 'phone.misplaced'
+        return cell, 'phone.invalid'
+    numbers = []
+    pos = 0
+    for m in matches:
+        label = _label(cell_dashes[pos:m.start()])
+        digits = NON_DIGIT_RE.sub('', m.group(1))
+        if label is None:
+            return cell, 'phone.extra-text'
+        if not NANP_RE.fullmatch(digits):
+            return cell, 'phone.invalid'
+        number = '+1' + digits + (f' ext. {m.group(2)}' if m.group(2) else '')
+        numbers.append(f'{label}: {number}' if label else number)
+        pos = m.end()
+    tail = _label(cell_dashes[pos:])
+    if tail is None:
+        return cell, 'phone.extra-text'
+    if tail:
+        # "303-555-0100 (toll free)": a trailing label names the last number
+        if ': ' in numbers[-1]:
+            return cell, 'phone.extra-text'
+        numbers[-1] = f'{tail}: {numbers[-1]}'
+    value = '; '.join(numbers)
+    return value, ('phone.normalized' if value != cell else None)
+
+
+def canonical_url(url):
+    """Canonical form of one URL, or None if it has no dotted host."""
+    if '://' not in url:
+        url = 'https://' + url
+    parts = urlsplit(url.rstrip('.,;)>'))
+    scheme, host = parts.scheme.lower(), parts.netloc.lower()
+    if scheme in DEFAULT_PORTS:
+        host = host.removesuffix(DEFAULT_PORTS[scheme])
+    if '.' not in host:
+        return None
+    return urlunsplit((scheme, host, parts.path, parts.query, parts.fragment))
+
+
+def _repeat_key(url):
+    """url with the "/" of an otherwise empty path dropped, for spotting repeats."""
+    parts = urlsplit(url)
+    if parts.path == '/' and not parts.query and not parts.fragment:
+        return url[:-1]
+    return url
+
+
+def normalize_url(cell):
+    """Return (value, rule or None) for a Web/Link cell."""
+    lowered = SCHEME_RE.sub(lambda m: m.group(0).lower(), cell)
+    urls, email = split_web_email(lowered)
+    if email:
+        return cell, 'url.misplaced'
+    if urls == lowered and not any(s in lowered for s in ('http://', 'https://', 'www.')):
+        # Only "dav26co.org"-style hosts without scheme or www.
+        hosts = lowered.split()
+        if not all(BARE_HOST_RE.fullmatch(h) for h in hosts):
+            return cell, 'url.invalid'
+        urls = '; '.join(hosts)
+    canonical = {}
+    for url in urls.split('; '):
+        url = canonical_url(url)
+        if url is None:
+            return cell, 'url.invalid'
+        canonical.setdefault(_repeat_key(url), url)
+    value = '; '.join(canonical.values())
+    return value, ('url.normalized' if value != cell else None)
+
+
+def normalize_email(cell):
+    """Return (value, rule or None) for an Email cell."""
+    emails = [e for e in EMAIL_SPLIT_RE.split(cell.lower()) if e]
+    if not all(EMAIL_RE.fullmatch(e) for e in emails):
+        return cell, 'email.invalid'
+    value = '; '.join(dict.fromkeys(emails))
+    return value, ('email.normalized' if value != cell else None)
+
+
+FIELD_NORMALIZERS = (('phone', normalize_phone), ('url', normalize_url),
+                     ('email', normalize_email))
+NORMALIZERS = dict(FIELD_NORMALIZERS)
+FLAG_RULES = {rule for rule in RULES if not rule.endswith(('.normalized', '.placeholder'))}
+
+
+def usable(attr, cell):
+    """True if cell is a value validate_records() would neither clear nor flag."""
+    if not cell or cell.lower() in PLACEHOLDERS:
+        return False
+    normalize = NORMALIZERS.get(attr)
+    return normalize is None or normalize(cell)[1] not in FLAG_RULES
+
+
+def validate_records(records):
+    """Normalize Phone, Web/Link and Email of records in place; return the report."""
+    counts = Counter()
+    issues = []
+    for rec in records:
+        for attr, normalize in FIELD_NORMALIZERS:
+            cell = getattr(rec, attr)
+            if not cell:
+                continue
+            if cell.lower() in PLACEHOLDERS:
+                value, rule = '', f'{attr}.placeholder'
+            else:
+                value, rule = normalize(cell)
+            if rule is None:
+                continue
+            counts[rule] += 1
+            if value != cell:
+                setattr(rec, attr, value)
+            else:
+                issues.append({'id': rec.uid, 'name': rec.name, 'rule': rule, 'value': cell})
+    return {
+        'records': len(records),
+        'rules':   RULES,
+        'counts':  {rule: counts[rule] for rule in RULES},
+        'issues':  issues,
+    }
+
+
+def write_report(report, path):
+    with atomic_open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+        f.write('\n')
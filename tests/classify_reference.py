@@ -0,0 +1,52 @@
+"""
+The line classification and web/email splitting code as it was before
+consolidate.classify, kept as the reference that tests/test_classify.py
+pins the shared helpers against and benchmarks/bench_classify.py times.
+"""
+
+import re
+
+from consolidate.config import EMAIL_RE, PHONE_RE, TAG_FILES, URL_RE
+from consolidate.parsing import read_csv_raw
+
+
+def classify_line_inline(line, url_seen=False):
+    """The original STEP 5 chain, with labels instead of assignments."""
+    if PHONE_RE.search(line) and not url_seen and not re.search(r'https?://', line):
+        return 'phone'
+    elif URL_RE.search(line):
+        return 'url'
+    elif EMAIL_RE.search(line):
+        return 'email'
+    elif re.search(r'\d{3,}', line) and any(c in line.lower() for c in ['st', 'ave', 'blvd', 'dr', 'ln', 'rd', 'way', 'co ', 'colorado']):
+        return 'address'
+    return 'note'
+
+
+def split_web_email_inline(raw):
+    raw = raw.strip()
+    emails = EMAIL_RE.findall(raw)
+    urls   = [u.rstrip('.,;)>') for u in URL_RE.findall(raw)]
+    email = '; '.join(emails) if emails else ''
+    url   = '; '.join(urls)   if urls   else ''
+    if not email and not url and raw:
+        url = raw
+    return url, email
+
+
+def load_lines():
+    """Every non-name line of every Housing-Felon-Friendly cell."""
+    lines = []
+    for row in read_csv_raw('Housing-Felon-Friendly')[2:]:
+        if row and row[0].strip():
+            cell_lines = [l.strip() for l in row[0].strip().split('\n') if l.strip()]
+            lines.extend(cell_lines[1:])
+    return lines
+
+
+def load_web_cells():
+    """Every web/email cell of the standard sheets."""
+    cells = []
+    for fname in TAG_FILES:
+        cells.extend(row[2] for row in read_csv_raw(fname) if len(row) > 2)
+    return cells
@@ -0,0 +1,32 @@
+"""
+Shared fixtures.  Tests import the consolidate package from scripts/ and
+never touch the published files under data/: pipeline runs work on a copy.
+"""
+
+import os
+import shutil
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from consolidate.config import DATA_DIR  # noqa: E402
+from consolidate.pipeline import run  # noqa: E402
+
+
+@pytest.fixture
+def data_copy(tmp_path):
+    """A scratch copy of data/ (without reports) to run the pipeline against."""
+    work = tmp_path / 'data'
+    shutil.copytree(DATA_DIR, work, ignore=shutil.ignore_patterns('reports'))
+    return str(work)
+
+
+@pytest.fixture(scope='session')
+def build(tmp_path_factory):
+    """One pipeline run on a scratch copy of data/; its artifacts sit next to build.out_path."""
+    work = tmp_path_factory.mktemp('build') / 'data'
+    shutil.copytree(DATA_DIR, work, ignore=shutil.ignore_patterns('reports'))
+    build, _ = run(str(work), trace_memory=False, report=False)
+    return build
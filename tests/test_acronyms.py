@@ -0,0 +1,72 @@
+"""
+Acronym table loading, whole-token expansion and acronym-aware dedupe.
+"""
+
+import pytest
+
+from consolidate.acronyms import AcronymTable, load_acronyms
+from consolidate.dedupe import find_duplicates
+from consolidate.parsing import normalize_name
+from consolidate.record import Record
+
+
+@pytest.fixture(scope='module')
+def table():
+    return AcronymTable({'APS': 'Adult Protective Services', 'DD': 'Developmental Disabilities',
+                         'SSI': 'Social Security Income'})
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('APS referral', 'Adult Protective Services referral'),
+    ('SSI and DD waivers', 'Social Security Income and Developmental Disabilities waivers'),
+    ('SSIs', 'Social Security Income'),            # plural falls back to the singular
+    ('aps, Aps and ApS', 'aps, Aps and ApS'),      # lookups are case-sensitive
+    ('ADD, ODD, DDT', 'ADD, ODD, DDT'),            # only whole tokens
+    ('APS-x and xAPS', 'APS-x and xAPS'),
+    ('no acronyms here', 'no acronyms here'),
+])
+def test_expand(table, text, expected):
+    assert table.expand(text) == expected
+
+
+def test_expand_keep(table):
+    assert table.expand('APS referral', keep=True) == 'APS (Adult Protective Services) referral'
+
+
+def test_empty_table_leaves_text_alone():
+    assert AcronymTable({}).expand('APS referral') == 'APS referral'
+
+
+def test_from_csv_skips_unusable_rows(tmp_path):
+    path = tmp_path / 'Acronyms.csv'
+    path.write_text('Acronym,Spelled Out,Definition\n'
+                    'APS,Adult Protective Services,\n'
+                    'APS,Another Spelling,\n'
+                    'DD Determination,Something,\n'
+                    'M1/2/3/4,Mental Health Hold,\n'
+                    'OT,,\n'
+                    'SSI,. Social Security Income,\n', encoding='utf-8')
+    table = AcronymTable.from_csv(str(path))
+    assert table.expansions == {'APS': 'Adult Protective Services',
+                                'SSI': 'Social Security Income'}
+    assert table.synonyms() == {'aps': 'Adult Protective Services',
+                                'ssi': 'Social Security Income'}
+
+
+def test_missing_table_is_empty(tmp_path):
+    assert len(load_acronyms(str(tmp_path))) == 0
+
+
+def test_acronym_and_spelled_out_names_are_duplicates(table):
+    records = [Record('El Paso County APS', '719-444-5755'),
+               Record('El Paso County Adult Protective Services', '719-444-5755')]
+    keyed = {normalize_name(rec.name): rec for rec in records}
+    assert find_duplicates(keyed) == []
+    assert find_duplicates(keyed, table) == [
+        ('el paso county adult protective services', [('el paso county aps', 'same-name')])]
+
+
+def test_shipped_table_expands_published_acronyms():
+    table = load_acronyms()
+    assert table.expand('APS') == 'Adult Protective Services'
+    assert table.expand('dd and ot') == 'dd and ot'
@@ -0,0 +1,52 @@
+"""
+Pins line classification and web/email splitting.
+
+classify_line() and split_web_email() replaced an inline if/elif chain in
+the Housing-Felon-Friendly reader and per-reader regex code; on every line
+and cell of the shipped data they must give what the originals, kept in
+classify_reference.py, gave.
+"""
+
+import pytest
+
+from classify_reference import (
+    classify_line_inline, load_lines, load_web_cells, split_web_email_inline,
+)
+from consolidate.classify import classify_line, split_web_email
+
+
+@pytest.mark.parametrize('line, url_seen, label', [
+    ('719-555-0100', False, 'phone'),
+    ('719-555-0100', True, 'note'),
+    ('https://example.org/apply 719-555-0100', False, 'url'),
+    ('www.example.org', False, 'url'),
+    ('intake@example.org', False, 'email'),
+    ('1234 Main St, Pueblo', False, 'address'),
+    ('Call ahead for intake', False, 'note'),
+])
+def test_classify_line_examples(line, url_seen, label):
+    assert classify_line(line, url_seen) == label == classify_line_inline(line, url_seen)
+
+
+@pytest.mark.parametrize('raw, expected', [
+    ('https://example.org/. info@example.org', ('https://example.org/', 'info@example.org')),
+    ('www.a.org www.b.org', ('www.a.org; www.b.org', '')),
+    ('  see website  ', ('see website', '')),
+    ('', ('', '')),
+])
+def test_split_web_email_examples(raw, expected):
+    assert split_web_email(raw) == expected == split_web_email_inline(raw)
+
+
+def test_classify_line_matches_inline_on_shipped_data():
+    lines = load_lines()
+    assert lines
+    bad = [(l, s) for l in lines for s in (False, True)
+           if classify_line(l, s) != classify_line_inline(l, s)]
+    assert not bad
+
+
+def test_split_web_email_matches_inline_on_shipped_data():
+    cells = load_web_cells()
+    assert cells
+    assert [c for c in cells if split_web_email(c) != split_web_email_inline(c)] == []
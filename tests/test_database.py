@@ -0,0 +1,67 @@
+"""
+Master.sqlite built by the pipeline against the Master.csv written with it.
+"""
+
+import csv
+import re
+import sqlite3
+
+import pytest
+
+from consolidate.database import validate_database
+
+
+@pytest.fixture(scope='module')
+def rows(build):
+    with open(build.out_path, newline='', encoding='utf-8') as f:
+        return [dict(row) for row in csv.DictReader(f)]
+
+
+@pytest.fixture(scope='module')
+def conn(build):
+    conn = sqlite3.connect(f'file:{build.sqlite_path}?mode=ro', uri=True)
+    yield conn
+    conn.close()
+
+
+def row_tags(row):
+    return row['Tags'].split('; ') if row['Tags'] else []
+
+
+def test_row_counts_match_csv(rows, conn):
+    def count(table):
+        return conn.execute(f'SELECT count(*) FROM {table}').fetchone()[0]
+
+    assert count('resources') == len(rows) > 0
+    assert count('resources_fts') == len(rows)
+    assert count('tags') == len({t for row in rows for t in row_tags(row)})
+    assert count('resource_tags') == sum(len(row_tags(row)) for row in rows)
+
+
+def test_resources_follow_csv_order(rows, conn):
+    found = conn.execute('SELECT name, record_id FROM resources ORDER BY id').fetchall()
+    assert found == [(row['Name/Title'], row['Record ID']) for row in rows]
+
+
+def test_fts_match(rows, conn):
+    word = re.compile(r'(?<![a-z0-9])pantry(?![a-z0-9])')
+    expected = {i for i, row in enumerate(rows)
+                if word.search(row['Name/Title'].lower())
+                or word.search(row['Information/Details'].lower())}
+    found = {rid for rid, in conn.execute(
+        "SELECT rowid FROM resources_fts WHERE resources_fts MATCH 'pantry'")}
+    assert expected and found == expected
+
+
+def test_tag_query(rows, conn):
+    found = [rid for rid, in conn.execute('''
+        SELECT r.id FROM resources r
+          JOIN resource_tags rt ON rt.resource_id = r.id
+          JOIN tags t ON t.id = rt.tag_id
+         WHERE t.name = 'Food' ORDER BY r.id''')]
+    expected = [i for i, row in enumerate(rows) if 'Food' in row_tags(row)]
+    assert expected and found == expected
+
+
+def test_validate_database_accepts_build(build):
+    validate_database(build.sqlite_path, build.out_path)
@@ -0,0 +1,62 @@
+"""
+Fuzzy duplicate clustering and merging.
+"""
+
+from consolidate.dedupe import find_duplicates, merge_into
+from consolidate.parsing import normalize_name
+from consolidate.record import Record, tags_mask
+
+
+def keyed(*records):
+    return {normalize_name(rec.name): rec for rec in records}
+
+
+def clusters(records):
+    return sorted(sorted([survivor] + [k for k, _ in dups])
+                  for survivor, dups in find_duplicates(records))
+
+
+def test_branches_are_not_chained_through_a_generic_name():
+    records = keyed(Record('Salvation Army'),
+                    Record('Salvation Army (Pueblo)', '719-555-1111'),
+                    Record('Salvation Army (Denver)', '303-555-2222'))
+    for group in clusters(records):
+        assert not {'salvation army (pueblo)', 'salvation army (denver)'} <= set(group)
+
+
+def test_conflicting_phones_are_not_chained_through_a_phoneless_row():
+    records = {
+        'food bank': Record('Food Bank', '719-555-1111'),
+        'food bank ': Record('Food Bank ', ''),
+        'food bank  ': Record('Food  Bank', '303-555-2222'),
+    }
+    for group in clusters(records):
+        assert not {'food bank', 'food bank  '} <= set(group)
+
+
+def test_plain_duplicates_still_merge():
+    records = keyed(Record('Aspen Ridge Recovery', '855-281-5588'),
+                    Record('Aspen Ridge Recovery (sober living)', '855-281-5588'))
+    assert clusters(records) == [['aspen ridge recovery', 'aspen ridge recovery (sober living)']]
+
+
+def test_merge_appends_details_and_prefers_usable_phone():
+    survivor = Record('Aspen Ridge Recovery', 'Lakewood, Colorado Springs: https://example.org/',
+                      details='Sober living', tags=tags_mask(['Medical']))
+    dup = Record('Aspen Ridge Recovery (sober living)', '855-281-5588',
+                 details='Policy — Sex Offenses: X, M/F/A: M',
+                 tags=tags_mask(['Housing-Felon-Friendly']))
+    dropped = merge_into(survivor, dup)
+    assert survivor.phone == '855-281-5588'
+    assert survivor.details == 'Sober living | Policy — Sex Offenses: X, M/F/A: M'
+    assert survivor.tags == tags_mask(['Medical', 'Housing-Felon-Friendly'])
+    assert dropped == [('Phone', 'Lakewood, Colorado Springs: https://example.org/')]
+
+
+def test_merge_reports_conflicting_values_it_drops():
+    survivor = Record('Food Bank', '719-555-1111', 'https://a.example.org')
+    dup = Record('Food Bank (Main)', '719-555-1111', 'https://b.example.org', details='Food boxes')
+    dropped = merge_into(survivor, dup)
+    assert survivor.url == 'https://a.example.org'
+    assert survivor.details == 'Food boxes'
+    assert dropped == [('Web/Link', 'https://b.example.org')]
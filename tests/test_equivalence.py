@@ -0,0 +1,87 @@
+"""
+Regression tests: the faster build modes write the same Master.csv, index
+and search index as a plain full rebuild.
+"""
+
+import os
+
+from consolidate.incremental import file_digest
+from consolidate.pipeline import run
+
+ARTIFACTS = ('.csv', '.index.json', '.search.json')
+
+
+def artifacts(out_path):
+    """sha256 of Master.csv and of the JSON artifacts written next to it."""
+    stem = os.path.splitext(out_path)[0]
+    return {ext: file_digest(stem + ext) for ext in ARTIFACTS}
+
+
+def out_path(tmp_path, name):
+    path = tmp_path / name / 'Master.csv'
+    path.parent.mkdir()
+    return str(path)
+
+
+def append_row(path, row):
+    with open(path, 'r+', encoding='utf-8') as f:
+        text = f.read()
+        f.write(('' if text.endswith('\n') else '\n') + row + '\n')
+
+
+def edit_sheets(data_dir):
+    """Edit and add a Master-base.csv row; tag an existing record Food."""
+    path = os.path.join(data_dir, 'Master-base.csv')
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    text = text.replace('Sober Living, Olathe: women and women with children',
+                        'Sober Living, Olathe: women, and women with children', 1)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    append_row(path, 'Test Street Pantry,719-555-0142,https://pantry.example.org,,'
+                     '"1 Main St, Pueblo, CO 81003",Weekly food pantry')
+    append_row(os.path.join(data_dir, 'Food.csv'),
+               'A 2nd Chance Recovery Homes (Sober LIving),,,,Meals for residents')
+
+
+def test_incremental_matches_full_rebuild(data_copy, tmp_path, capsys):
+    manifest = str(tmp_path / 'manifest.pickle')
+    incremental = out_path(tmp_path, 'incremental')
+    full = out_path(tmp_path, 'full')
+
+    run(data_copy, incremental, trace_memory=False, report=False,
+        incremental=True, manifest_path=manifest)
+    edit_sheets(data_copy)
+    capsys.readouterr()
+    build, _ = run(data_copy, incremental, trace_memory=False, report=False,
+                   incremental=True, manifest_path=manifest)
+    assert 'Incremental: 2 changed source(s)' in capsys.readouterr().out
+    run(data_copy, full, trace_memory=False, report=False)
+
+    names = {rec.name: rec for rec in build.sorted_records}
+    assert 'Test Street Pantry' in names
+    assert 'Food' in names['A 2nd Chance Recovery Homes (Sober LIving)'].row()[6]
+    assert artifacts(incremental) == artifacts(full)
+
+
+def test_parallel_parse_matches_serial(data_copy, tmp_path):
+    serial = out_path(tmp_path, 'serial')
+    parallel = out_path(tmp_path, 'parallel')
+    run(data_copy, serial, trace_memory=False, report=False)
+    run(data_copy, parallel, trace_memory=False, report=False, jobs=2)
+    assert artifacts(parallel) == artifacts(serial)
+
+
+def test_low_memory_matches_default(data_copy, tmp_path):
+    default = out_path(tmp_path, 'default')
+    streamed = out_path(tmp_path, 'streamed')
+    run(data_copy, default, trace_memory=False, report=False)
+    run(data_copy, streamed, trace_memory=False, report=False, low_memory=True)
+    assert artifacts(streamed) == artifacts(default)
+
+
+def test_stages_leave_carried_records_alone(build):
+    # build.keyed is pickled into the manifest and carried by incremental runs
+    published = {id(rec) for rec in build.sorted_records}
+    assert all(not rec.uid and rec.lat is None for rec in build.keyed.values())
+    assert not any(id(rec) in published for rec in build.keyed.values())
@@ -0,0 +1,31 @@
+import pytest
+
+from consolidate.geo import geocode
+
+
+@pytest.mark.parametrize('address, place', [
+    ('1500 Illinois St, Golden, CO 80401', 'Golden'),
+    ('207 East Avenue, Rifle CO 81650 or 824 Cooper Ave, Glenwood Springs, CO 81601',
+     'Glenwood Springs'),
+    ('Denver, CO', 'Denver'),
+    ('Colorado Springs', 'Colorado Springs'),
+    ('Grand Junction, Montrose, Online; 2508 Blichmann Ave Grand Junction CO 81505',
+     'Grand Junction'),
+    ('Evans St', None),
+    ('Aurora, IL', None),
+])
+def test_geocode_place(address, place):
+    found = geocode(address)
+    assert (found and found[0]) == place
+
+
+@pytest.mark.parametrize('address', [
+    'Denver, Pueblo',
+    'Denver/Aurora',
+    'Lakewood, Colorado Springs, Fort Collins, Virtual Care: https://reachonlinerecovery.com/',
+    'Mesa, Montrose, Delta, & Ouray Counties, CO',
+    'Aurora, Boulder, Castle Rock, Centennial, C/S, Denver, Evergreen, Ft. Collins, Greeley, '
+    'Lakewood, Longmont, Loveland, Pueblo, Thornton, Westminster',
+])
+def test_service_area_is_not_geocoded(address):
+    assert geocode(address) is None
@@ -0,0 +1,39 @@
+"""
+Regression tests: rebuilding from unchanged inputs gives a byte-identical
+Master.csv, check_idempotent() leaves the published files alone, and the
+published Master.csv and JSON artifacts are what the current code builds.
+"""
+
+import os
+
+from consolidate.config import DATA_DIR
+from consolidate.incremental import file_digest
+from consolidate.pipeline import check_idempotent, run
+
+RUNS = 3
+
+
+def test_rebuild_is_byte_identical(data_copy, tmp_path):
+    out_path = str(tmp_path / 'out' / 'Master.csv')
+    os.makedirs(os.path.dirname(out_path))
+    results = []
+    for _ in range(RUNS):
+        run(data_copy, out_path, trace_memory=False, report=False)
+        results.append((os.path.getsize(out_path), file_digest(out_path)))
+    assert results[0][0] > 0
+    assert results == [results[0]] * RUNS
+
+
+def test_check_idempotent_leaves_published_files_alone():
+    published = os.path.join(DATA_DIR, 'Master.csv')
+    before = (os.path.getmtime(published), file_digest(published))
+    results = check_idempotent(2)
+    assert len(set(results)) == 1
+    assert (os.path.getmtime(published), file_digest(published)) == before
+
+
+def test_published_artifacts_match_the_code(build):
+    # A change that alters the output must commit the regenerated files with it
+    for name in ('Master.csv', 'Master.index.json', 'Master.search.json'):
+        built = os.path.join(os.path.dirname(build.out_path), name)
+        assert file_digest(built) == file_digest(os.path.join(DATA_DIR, name)), name
@@ -0,0 +1,36 @@
+"""
+Master.index.json and Master.search.json built by the pipeline against the
+Master.csv written with them.
+"""
+
+import csv
+import json
+
+import pytest
+
+from consolidate.index import FIELD_COLS, INDEX_VERSION, validate_index
+from consolidate.search import SearchIndex
+
+
+@pytest.fixture(scope='module')
+def rows(build):
+    with open(build.out_path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def test_index_records_carry_record_ids(build, rows):
+    with open(build.index_path, encoding='utf-8') as f:
+        index = json.load(f)
+    assert index['version'] == INDEX_VERSION
+    assert index['columns'] == FIELD_COLS
+    col = FIELD_COLS.index('Record ID')
+    assert [rec[col] for rec in index['records']] == [row['Record ID'] for row in rows]
+    validate_index(build.index_path, build.out_path)
+
+
+def test_search_returns_record_ids(build, rows):
+    index = SearchIndex.load(build.search_path)
+    assert index.ids == [row['Record ID'] for row in rows]
+    found = index.rank('food pantry', k=5)
+    assert found
+    assert index.search('food pantry', k=5) == [rows[row]['Record ID'] for row in found]
@@ -0,0 +1,92 @@
+import json
+import os
+
+import pytest
+
+from consolidate.record import Record
+from consolidate.validate import (FIELD_NORMALIZERS, RULES, normalize_email,
+                                  normalize_phone, normalize_url, validate_records)
+
+
+@pytest.mark.parametrize('cell, expected', [
+    ('office: 303-985-1776', ('office: +13039851776', 'phone.normalized')),
+    ('24 hr:970-356-4226', ('24 hr: +19703564226', 'phone.normalized')),
+    ('7-859-444', ('7-859-444', 'phone.invalid')),
+    ('+13039851776', ('+13039851776', None)),
+    ('+1 (303) 985-1776', ('+13039851776', 'phone.normalized')),
+    ('719-555-0100 ext. 12', ('+17195550100 ext. 12', 'phone.normalized')),
+    ('(719) 465-6542 x 3', ('+17194656542 ext. 3', 'phone.normalized')),
+    ('303-555-0100 (toll free)', ('toll free: +13035550100', 'phone.normalized')),
+    ('719-465-6542 or 719-465-6543', ('+17194656542; +17194656543', 'phone.normalized')),
+    ('office: 303-985-1776 (main)', ('office: 303-985-1776 (main)', 'phone.extra-text')),
+    ('Call 719-465-6542 after noon', ('Call 719-465-6542 after noon', 'phone.extra-text')),
+    ('info@a.org', ('info@a.org', 'phone.misplaced')),
+    ('123-456-7890', ('123-456-7890', 'phone.invalid')),
+])
+def test_normalize_phone(cell, expected):
+    assert normalize_phone(cell) == expected
+
+
+@pytest.mark.parametrize('cell, expected', [
+    ('https://a.org', ('https://a.org', None)),
+    ('HTTP://Foo.ORG:80/a', ('http://foo.org/a', 'url.normalized')),
+    ('WWW.Foo.org', ('https://www.foo.org', 'url.normalized')),
+    ('https://a.org:443/x.', ('https://a.org/x', 'url.normalized')),
+    ('https://a.org https://a.org/', ('https://a.org', 'url.normalized')),
+    ('dav26co.org', ('https://dav26co.org', 'url.normalized')),
+    ('see website', ('see website', 'url.invalid')),
+    ('info@a.org', ('info@a.org', 'url.misplaced')),
+])
+def test_normalize_url(cell, expected):
+    assert normalize_url(cell) == expected
+
+
+@pytest.mark.parametrize('cell, expected', [
+    ('info@a.org', ('info@a.org', None)),
+    ('Info@A.org, info@a.org', ('info@a.org', 'email.normalized')),
+    ('info at a.org', ('info at a.org', 'email.invalid')),
+])
+def test_normalize_email(cell, expected):
+    assert normalize_email(cell) == expected
+
+
+def test_validate_records_clears_placeholders_and_counts_rules():
+    records = [
+        Record('A', phone='Not Found', url='n/a', email='none'),
+        Record('B', phone='office: 303-985-1776', url='HTTP://B.org', email='B@b.org'),
+        Record('C', phone='7-859-444', url='see website', email='c at c.org'),
+    ]
+    report = validate_records(records)
+    assert [(r.phone, r.url, r.email) for r in records] == [
+        ('', '', ''),
+        ('office: +13039851776', 'http://b.org', 'b@b.org'),
+        ('7-859-444', 'see website', 'c at c.org'),
+    ]
+    assert report['records'] == 3
+    assert set(report['counts']) == set(RULES)
+    assert {rule: n for rule, n in report['counts'].items() if n} == {
+        'phone.placeholder': 1, 'url.placeholder': 1, 'email.placeholder': 1,
+        'phone.normalized': 1, 'url.normalized': 1, 'email.normalized': 1,
+        'phone.invalid': 1, 'url.invalid': 1, 'email.invalid': 1,
+    }
+    assert [(i['name'], i['rule']) for i in report['issues']] == [
+        ('C', 'phone.invalid'), ('C', 'url.invalid'), ('C', 'email.invalid')]
+
+
+def test_quality_report_matches_issues(build):
+    with open(os.path.join(build.report_dir, 'quality.json'), encoding='utf-8') as f:
+        report = json.load(f)
+    assert report['records'] == len(build.sorted_records)
+    flagged = {rule: n for rule, n in report['counts'].items()
+               if not rule.endswith(('.normalized', '.placeholder'))}
+    assert sum(flagged.values()) == len(report['issues'])
+
+
+def test_normalizing_published_records_again_changes_nothing(build):
+    # Incremental runs carry validated records over and validate them again
+    for rec in build.sorted_records:
+        for attr, normalize in FIELD_NORMALIZERS:
+            cell = getattr(rec, attr)
+            if cell:
+                value, rule = normalize(cell)
+                assert value == cell and not (rule or '').endswith('.normalized'), (rec.name, attr)